@@ -1,40 +1,158 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import os
 import sqlite3
+import sys
+import threading
+import weakref
+import zlib
+from array import array
+from collections.abc import Iterable
 from pathlib import Path
 
 
-def _default_cache_path() -> Path:
+_SCHEMA_VERSION = 5
+_MAX_SQL_VARIABLES = 900
+_OPTIMIZE_PAGE_GROWTH = 1024
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
+
+_CODEC_RAW = b"\x00"
+_CODEC_ZLIB = b"\x01"
+_ZLIB_LEVEL = 1
+
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    cache_key BLOB PRIMARY KEY,
+    vector_blob BLOB NOT NULL
+) WITHOUT ROWID
+"""
+
+
+_CREATE_META_TABLE = """
+CREATE TABLE IF NOT EXISTS cache_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID
+"""
+
+
+def default_cache_path() -> Path:
     override = os.getenv("EMBX_CACHE_PATH")
     if override:
         return Path(override).expanduser()
     return Path.home() / ".cache" / "embx" / "cache.db"
 
 
+def _pack_vector(vector: list[float]) -> bytes:
+    packed = array("d", vector)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    raw = packed.tobytes()
+    compressed = zlib.compress(raw, _ZLIB_LEVEL)
+    if len(compressed) < len(raw):
+        return _CODEC_ZLIB + compressed
+    return _CODEC_RAW + raw
+
+
+def _unpack_vector(blob: bytes) -> list[float]:
+    codec, payload = blob[:1], blob[1:]
+    if codec == _CODEC_ZLIB:
+        payload = zlib.decompress(payload)
+    unpacked = array("d")
+    unpacked.frombytes(payload)
+    if sys.byteorder == "big":
+        unpacked.byteswap()
+    return unpacked.tolist()
+
+
 class EmbeddingCache:
     def __init__(self, enabled: bool, path: Path | None = None) -> None:
         self.enabled = enabled
-        self.path = path or _default_cache_path()
+        self.path = path or default_cache_path()
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
         if self.enabled:
             self.path.parent.mkdir(parents=True, exist_ok=True)
             self._init_db()
 
-    def _connect(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.path)
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            for pragma in _PRAGMAS:
+                conn.execute(pragma)
+            self._conn = conn
+            self._finalizer = weakref.finalize(self, conn.close)
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            self._finalizer()
+            self._conn = None
 
     def _init_db(self) -> None:
-        with self._connect() as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS embeddings (
-                    cache_key TEXT PRIMARY KEY,
-                    vector_json TEXT NOT NULL
-                )
-                """
-            )
+        with self._lock:
+            conn = self._connection()
+            if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+                with conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    version = conn.execute("PRAGMA user_version").fetchone()[0]
+                    if version < _SCHEMA_VERSION:
+                        self._migrate(conn)
+                        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            self._maybe_optimize(conn)
+
+    @staticmethod
+    def _maybe_optimize(conn: sqlite3.Connection) -> None:
+        # Re-run PRAGMA optimize once the file has grown noticeably since the last run.
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        row = conn.execute(
+            "SELECT value FROM cache_meta WHERE key = 'optimized_page_count'"
+        ).fetchone()
+        if row is not None and page_count - row[0] < _OPTIMIZE_PAGE_GROWTH:
+            return
+        conn.execute("PRAGMA optimize")
+        EmbeddingCache._record_optimized(conn)
+
+    @staticmethod
+    def _record_optimized(conn: sqlite3.Connection) -> None:
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_meta(key, value) VALUES ('optimized_page_count', ?)",
+            (page_count,),
+        )
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        # Released caches predate user_version and used SHA-256 keys with JSON vectors,
+        # which can never be looked up again; start over on anything older than current.
+        conn.execute("DROP TABLE IF EXISTS embeddings")
+        conn.execute(_CREATE_TABLE)
+        conn.execute(_CREATE_META_TABLE)
+
+    def vacuum(self) -> tuple[int, int]:
+        """Optimize and rebuild the database file, returning its size before and after."""
+        if not self.enabled:
+            return (0, 0)
+        with self._lock:
+            conn = self._connection()
+            size_before = self.path.stat().st_size
+            conn.execute("PRAGMA optimize")
+            conn.execute("VACUUM")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._record_optimized(conn)
+            size_after = self.path.stat().st_size
+        return (size_before, size_after)
 
     @staticmethod
     def build_key(
@@ -42,9 +160,25 @@ class EmbeddingCache:
         model: str,
         dimensions: int | None,
         text: str,
-    ) -> str:
+    ) -> bytes:
         raw = f"{provider}|{model}|{dimensions or 0}|{text}".encode("utf-8")
-        return hashlib.sha256(raw).hexdigest()
+        return hashlib.blake2b(raw, digest_size=16).digest()
+
+    @staticmethod
+    def build_keys(
+        provider: str,
+        model: str,
+        dimensions: int | None,
+        texts: Iterable[str],
+    ) -> list[bytes]:
+        prefix = f"{provider}|{model}|{dimensions or 0}|".encode("utf-8")
+        base = hashlib.blake2b(prefix, digest_size=16)
+        keys: list[bytes] = []
+        for text in texts:
+            hasher = base.copy()
+            hasher.update(text.encode("utf-8"))
+            keys.append(hasher.digest())
+        return keys
 
     def get(
         self,
@@ -56,14 +190,42 @@ class EmbeddingCache:
         if not self.enabled:
             return None
         cache_key = self.build_key(provider, model, dimensions, text)
-        with self._connect() as conn:
-            row = conn.execute(
-                "SELECT vector_json FROM embeddings WHERE cache_key = ?",
+        with self._lock:
+            cursor = self._connection().execute(
+                "SELECT vector_blob FROM embeddings WHERE cache_key = ?",
                 (cache_key,),
-            ).fetchone()
+            )
+            row = cursor.fetchone()
         if not row:
             return None
-        return json.loads(row[0])
+        return _unpack_vector(row[0])
+
+    def get_many(
+        self,
+        provider: str,
+        model: str,
+        dimensions: int | None,
+        texts: list[str],
+    ) -> dict[str, list[float]]:
+        if not self.enabled or not texts:
+            return {}
+        text_by_key = dict(zip(self.build_keys(provider, model, dimensions, texts), texts))
+        cache_keys = list(text_by_key)
+
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            conn = self._connection()
+            for start in range(0, len(cache_keys), _MAX_SQL_VARIABLES):
+                chunk = cache_keys[start : start + _MAX_SQL_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    "SELECT cache_key, vector_blob FROM embeddings "
+                    f"WHERE cache_key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for cache_key, vector_blob in rows:
+                    found[text_by_key[cache_key]] = _unpack_vector(vector_blob)
+        return found
 
     def set(
         self,
@@ -76,8 +238,31 @@ class EmbeddingCache:
         if not self.enabled:
             return
         cache_key = self.build_key(provider, model, dimensions, text)
-        with self._connect() as conn:
-            conn.execute(
-                "INSERT OR REPLACE INTO embeddings(cache_key, vector_json) VALUES (?, ?)",
-                (cache_key, json.dumps(vector)),
+        with self._lock:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO embeddings(cache_key, vector_blob) VALUES (?, ?)",
+                (cache_key, _pack_vector(vector)),
             )
+
+    def set_many(
+        self,
+        provider: str,
+        model: str,
+        dimensions: int | None,
+        items: list[tuple[str, list[float]]],
+    ) -> None:
+        if not self.enabled or not items:
+            return
+        cache_keys = self.build_keys(provider, model, dimensions, (text for text, _ in items))
+        rows = [
+            (cache_key, _pack_vector(vector))
+            for cache_key, (_, vector) in zip(cache_keys, items, strict=True)
+        ]
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("BEGIN")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings(cache_key, vector_blob) VALUES (?, ?)",
+                    rows,
+                )
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+import sys
+
 import typer
 
 from embx import __version__
@@ -13,6 +16,8 @@ app = typer.Typer(
 )
 config_app = typer.Typer(help="Manage embx configuration")
 app.add_typer(config_app, name="config")
+cache_app = typer.Typer(help="Maintain the local embedding cache")
+app.add_typer(cache_app, name="cache")
 
 
 def _version_callback(value: bool) -> None:
@@ -34,7 +39,19 @@ def _main_callback(
     _ = version
 
 
-register_all_commands(app=app, config_app=config_app)
+def _requested_command(argv: list[str]) -> str | None:
+    # Shell completion needs every command registered.
+    if len(argv) < 2 or os.getenv("_EMBX_COMPLETE"):
+        return None
+    return argv[1]
+
+
+register_all_commands(
+    app=app,
+    config_app=config_app,
+    cache_app=cache_app,
+    command_name=_requested_command(sys.argv),
+)
 
 
 def main() -> None:
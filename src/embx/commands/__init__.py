@@ -1,27 +1,39 @@
 from __future__ import annotations
 
+from importlib import import_module
+
 import typer
 
 
-def register_all_commands(app: typer.Typer, config_app: typer.Typer) -> None:
-    from embx.commands.batch import register_batch_command
-    from embx.commands.compare import register_compare_command
-    from embx.commands.connect import register_connect_command
-    from embx.commands.config import register_config_commands
-    from embx.commands.doctor import register_doctor_command
-    from embx.commands.embed import register_embed_command
-    from embx.commands.models import register_models_command
-    from embx.commands.ping import register_ping_command
-    from embx.commands.providers import register_providers_command
-    from embx.commands.quickstart import register_quickstart_command
+_COMMAND_REGISTRARS: dict[str, tuple[str, str]] = {
+    "providers": ("embx.commands.providers", "register_providers_command"),
+    "models": ("embx.commands.models", "register_models_command"),
+    "connect": ("embx.commands.connect", "register_connect_command"),
+    "doctor": ("embx.commands.doctor", "register_doctor_command"),
+    "ping": ("embx.commands.ping", "register_ping_command"),
+    "quickstart": ("embx.commands.quickstart", "register_quickstart_command"),
+    "embed": ("embx.commands.embed", "register_embed_command"),
+    "batch": ("embx.commands.batch", "register_batch_command"),
+    "compare": ("embx.commands.compare", "register_compare_command"),
+    "config": ("embx.commands.config", "register_config_commands"),
+    "cache": ("embx.commands.cache", "register_cache_commands"),
+}
+
+
+def register_all_commands(
+    app: typer.Typer,
+    config_app: typer.Typer,
+    cache_app: typer.Typer,
+    command_name: str | None = None,
+) -> None:
+    """Register CLI commands, importing only `command_name`'s module when it is known."""
+    if command_name in _COMMAND_REGISTRARS:
+        names = [command_name]
+    else:
+        names = list(_COMMAND_REGISTRARS)
 
-    register_providers_command(app)
-    register_models_command(app)
-    register_connect_command(app)
-    register_doctor_command(app)
-    register_ping_command(app)
-    register_quickstart_command(app)
-    register_embed_command(app)
-    register_batch_command(app)
-    register_compare_command(app)
-    register_config_commands(config_app)
+    group_apps = {"config": config_app, "cache": cache_app}
+    for name in names:
+        module_name, registrar_name = _COMMAND_REGISTRARS[name]
+        registrar = getattr(import_module(module_name), registrar_name)
+        registrar(group_apps.get(name, app))
@@ -1,12 +1,40 @@
 from __future__ import annotations
 
-import asyncio
-import json
+import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import Any
 
 import typer
 
-from embx.commands.shared import emit_csv, fail
+from embx.commands.shared import dumps_json_line, emit_csv, fail, iter_json_array, run_async
+
+
+_OUTPUT_FORMATS = frozenset(("json", "jsonl", "csv"))
+
+
+def _iter_encoded_rows(rows: Iterable[dict[str, Any]], output_format: str) -> Iterator[bytes]:
+    if output_format == "jsonl":
+        for row in rows:
+            yield dumps_json_line(row) + b"\n"
+        return
+
+    for chunk in iter_json_array(rows):
+        yield chunk.encode("utf-8")
+    yield b"\n"
+
+
+def _write_stdout(chunks: Iterable[bytes]) -> None:
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # Text-only stdout, e.g. an embedding host or redirect_stdout(io.StringIO()).
+        for chunk in chunks:
+            sys.stdout.write(chunk.decode("utf-8"))
+        sys.stdout.flush()
+        return
+    buffer.writelines(chunks)
+    buffer.flush()
 
 
 def register_batch_command(app: typer.Typer) -> None:
@@ -32,18 +60,29 @@ def register_batch_command(app: typer.Typer) -> None:
         ),
     ) -> None:
         from embx.config import resolve_config
-        from embx.engine import EmbeddingEngine
+        from embx.engine import get_engine
         from embx.exceptions import ConfigurationError, ProviderError, ValidationError
 
-        if output_format not in {"json", "jsonl", "csv"}:
+        if output_format not in _OUTPUT_FORMATS:
             fail("--format must be one of: jsonl, json, csv", code=2)
 
+        texts: list[str] = []
         try:
-            lines = input_file.read_text(encoding="utf-8").splitlines()
+            with input_file.open("rb") as handle:
+                for raw_line in handle:
+                    if not raw_line.strip():
+                        continue
+                    # A \n-terminated chunk can still hold the other str.splitlines()
+                    # breaks (lone \r, \v, \x1c, \u2028, ...), so split it the same way.
+                    for part in raw_line.decode("utf-8").splitlines():
+                        line = part.strip()
+                        if line:
+                            texts.append(line)
         except OSError as exc:
             fail(f"Unable to read {input_file}: {exc}", code=2)
+        except UnicodeDecodeError as exc:
+            fail(f"Unable to decode {input_file} as UTF-8: {exc}", code=2)
 
-        texts = [line.strip() for line in lines if line.strip()]
         if not texts:
             fail("Input file has no non-empty lines.", code=2)
 
@@ -56,10 +95,11 @@ def register_batch_command(app: typer.Typer) -> None:
             }
             cfg = resolve_config(overrides)
             provider_name = provider or str(cfg.get("default_provider"))
-            engine = EmbeddingEngine(cfg)
-            results = asyncio.run(
+            engine = get_engine(cfg)
+            unique_texts = list(dict.fromkeys(texts))
+            unique_results = run_async(
                 engine.embed_texts(
-                    texts=texts,
+                    texts=unique_texts,
                     provider_name=provider_name,
                     model=model,
                     dimensions=dimensions,
@@ -69,20 +109,20 @@ def register_batch_command(app: typer.Typer) -> None:
         except (ValidationError, ConfigurationError, ProviderError) as exc:
             fail(str(exc), code=2)
 
-        rows = [item.to_dict() for item in results]
-        if output_format == "json":
-            payload = json.dumps(rows, indent=2)
-        elif output_format == "csv":
-            emit_csv(rows, output)
+        result_by_text = dict(zip(unique_texts, unique_results, strict=True))
+        results = [result_by_text[text] for text in texts]
+
+        if output_format == "csv":
+            emit_csv([item.to_dict() for item in results], output)
             return
-        else:
-            payload = "\n".join(json.dumps(row) for row in rows)
 
+        rows = (item.to_dict() for item in results)
         if output:
             output.parent.mkdir(parents=True, exist_ok=True)
-            output.write_text(payload + "\n", encoding="utf-8")
+            with output.open("wb") as handle:
+                handle.writelines(_iter_encoded_rows(rows, output_format))
             typer.secho(
-                f"Wrote {len(rows)} embeddings to {output}", fg=typer.colors.GREEN, err=True
+                f"Wrote {len(results)} embeddings to {output}", fg=typer.colors.GREEN, err=True
             )
             return
-        typer.echo(payload)
+        _write_stdout(_iter_encoded_rows(rows, output_format))
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import typer
+
+from embx.commands.shared import emit_json, fail
+
+
+def register_cache_commands(cache_app: typer.Typer) -> None:
+    @cache_app.command("vacuum")
+    def cache_vacuum(
+        json_output: bool = typer.Option(False, "--json", help="Print result as JSON"),
+    ) -> None:
+        import sqlite3
+
+        from embx.cache import EmbeddingCache, default_cache_path
+
+        path = default_cache_path()
+        if not path.exists():
+            fail(f"No cache database found at {path}.", code=2)
+
+        cache = EmbeddingCache(enabled=True, path=path)
+        try:
+            size_before, size_after = cache.vacuum()
+        except sqlite3.Error as exc:
+            fail(f"Unable to vacuum cache at {path}: {exc}", code=2)
+        finally:
+            cache.close()
+
+        if json_output:
+            emit_json(
+                {
+                    "path": str(path),
+                    "size_before_bytes": size_before,
+                    "size_after_bytes": size_after,
+                }
+            )
+            return
+        typer.secho(
+            f"Vacuumed {path}: {size_before} -> {size_after} bytes",
+            fg=typer.colors.GREEN,
+        )
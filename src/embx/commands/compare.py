@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-import sys
 import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -10,16 +10,51 @@ import typer
 
 from embx.commands.shared import (
     collect_single_text,
+    configured_provider_names,
     emit_csv,
     emit_json,
     emit_markdown,
     fail,
-    is_provider_configured,
+    get_console,
     parse_provider_list,
+    run_async,
     safe_vector_preview,
 )
 
 
+_OUTPUT_FORMATS = frozenset(("pretty", "json", "csv", "md"))
+_COMPARE_COLUMNS = (
+    "Rank",
+    "Provider",
+    "Status",
+    "Model",
+    "Dim",
+    "Cached",
+    "Latency ms",
+    "Cost USD",
+    "Quality",
+    "Message",
+)
+
+
+def _blank_if_none(render: Callable[[Any], str]) -> Callable[[Any], str]:
+    return lambda value: "" if value is None else render(value)
+
+
+# Cell renderers for every pretty column except the trailing "Message".
+_PRETTY_CELLS: tuple[tuple[str, Callable[[Any], str]], ...] = (
+    ("rank", _blank_if_none(str)),
+    ("provider", str),
+    ("status", str),
+    ("model", lambda value: str(value or "")),
+    ("dimensions", _blank_if_none(str)),
+    ("cached", str),
+    ("latency_ms", "{:.3f}".format),
+    ("cost_usd", _blank_if_none("{:.8f}".format)),
+    ("quality_score", _blank_if_none(lambda value: f"{float(value):.6f}")),
+)
+
+
 async def _compare_provider(
     *,
     engine: Any,
@@ -31,7 +66,7 @@ async def _compare_provider(
 ) -> dict[str, Any]:
     from embx.exceptions import ConfigurationError, ProviderError, ValidationError
 
-    started = time.perf_counter()
+    started_ns = time.perf_counter_ns()
     try:
         results = await engine.embed_texts(
             texts=[input_text],
@@ -41,7 +76,7 @@ async def _compare_provider(
             use_cache=use_cache,
         )
         result = results[0]
-        elapsed_ms = (time.perf_counter() - started) * 1000
+        elapsed_ms = (time.perf_counter_ns() - started_ns) / 1_000_000
         return {
             "provider": provider_name,
             "status": "ok",
@@ -51,26 +86,103 @@ async def _compare_provider(
             "latency_ms": round(elapsed_ms, 3),
             "cost_usd": result.cost_usd,
             "input_tokens": result.input_tokens,
-            "vector_preview": safe_vector_preview(result.vector, size=6),
+            "vector_preview": None,
             "quality_score": None,
             "error": None,
             "_vector": result.vector,
         }
     except (ValidationError, ConfigurationError, ProviderError, Exception) as exc:
-        elapsed_ms = (time.perf_counter() - started) * 1000
-        return {
-            "provider": provider_name,
-            "status": "error",
-            "model": model,
-            "dimensions": None,
-            "cached": False,
-            "latency_ms": round(elapsed_ms, 3),
-            "cost_usd": None,
-            "input_tokens": None,
-            "vector_preview": None,
-            "quality_score": None,
-            "error": str(exc),
-        }
+        elapsed_ms = (time.perf_counter_ns() - started_ns) / 1_000_000
+        return _error_row(provider_name, model, elapsed_ms, exc)
+
+
+def _error_row(
+    provider_name: str, model: str | None, elapsed_ms: float, exc: BaseException
+) -> dict[str, Any]:
+    return {
+        "provider": provider_name,
+        "status": "error",
+        "model": model,
+        "dimensions": None,
+        "cached": False,
+        "latency_ms": round(elapsed_ms, 3),
+        "cost_usd": None,
+        "input_tokens": None,
+        "vector_preview": None,
+        "quality_score": None,
+        "error": str(exc),
+    }
+
+
+def _timeout_seconds(engine: Any) -> int:
+    return int(engine.config.get("timeout_seconds", 30))
+
+
+async def _run_compare(
+    *,
+    engine: Any,
+    input_text: str,
+    provider_names: list[str],
+    model: str | None,
+    dimensions: int | None,
+    use_cache: bool,
+    max_concurrency: int = 8,
+) -> list[dict[str, Any]]:
+    from embx.providers.base import shared_http_client
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def compare_with_limit(provider_name: str) -> dict[str, Any]:
+        async with semaphore:
+            return await _compare_provider(
+                engine=engine,
+                input_text=input_text,
+                provider_name=provider_name,
+                model=model,
+                dimensions=dimensions,
+                use_cache=use_cache,
+            )
+
+    # One pooled client means one connection per distinct endpoint, not per provider call.
+    async with shared_http_client(_timeout_seconds(engine)):
+        results = await asyncio.gather(
+            *(compare_with_limit(provider_name) for provider_name in provider_names),
+            return_exceptions=True,
+        )
+    return [
+        _error_row(provider_name, model, 0.0, result)
+        if isinstance(result, BaseException)
+        else result
+        for provider_name, result in zip(provider_names, results, strict=True)
+    ]
+
+
+async def _run_compare_fail_fast(
+    *,
+    engine: Any,
+    input_text: str,
+    provider_names: list[str],
+    model: str | None,
+    dimensions: int | None,
+    use_cache: bool,
+) -> list[dict[str, Any]]:
+    from embx.providers.base import shared_http_client
+
+    rows: list[dict[str, Any]] = []
+    async with shared_http_client(_timeout_seconds(engine)):
+        for provider_name in provider_names:
+            row = await _compare_provider(
+                engine=engine,
+                input_text=input_text,
+                provider_name=provider_name,
+                model=model,
+                dimensions=dimensions,
+                use_cache=use_cache,
+            )
+            rows.append(row)
+            if row["status"] == "error":
+                break
+    return rows
 
 
 def register_compare_command(app: typer.Typer) -> None:
@@ -123,6 +235,12 @@ def register_compare_command(app: typer.Typer) -> None:
             "--continue-on-error/--fail-fast",
             help="Continue comparing other providers if one fails.",
         ),
+        max_concurrency: int = typer.Option(
+            8,
+            "--max-concurrency",
+            min=1,
+            help="Maximum providers queried at once.",
+        ),
         retries: int | None = typer.Option(None, "--retries", min=0, help="Retry attempts"),
         retry_backoff: float | None = typer.Option(
             None,
@@ -132,11 +250,11 @@ def register_compare_command(app: typer.Typer) -> None:
         ),
     ) -> None:
         from embx.config import resolve_config
-        from embx.engine import EmbeddingEngine
+        from embx.engine import get_engine
         from embx.exceptions import ConfigurationError
         from embx.ranking import apply_ranking, strip_private_fields, supported_rankings
 
-        if output_format not in {"pretty", "json", "csv", "md"}:
+        if output_format not in _OUTPUT_FORMATS:
             fail("--format must be one of: pretty, json, csv, md", code=2)
 
         ranking_options = supported_rankings()
@@ -157,15 +275,14 @@ def register_compare_command(app: typer.Typer) -> None:
                     "retry_backoff_seconds": retry_backoff,
                 }
             )
-            engine = EmbeddingEngine(cfg)
+            engine = get_engine(cfg)
         except ConfigurationError as exc:
             fail(str(exc), code=2)
 
         if only_configured:
+            configured = configured_provider_names(provider_names, cfg)
             provider_names = [
-                provider_name
-                for provider_name in provider_names
-                if is_provider_configured(provider_name, cfg)
+                provider_name for provider_name in provider_names if provider_name in configured
             ]
             if not provider_names:
                 fail(
@@ -175,57 +292,49 @@ def register_compare_command(app: typer.Typer) -> None:
 
         rows: list[dict[str, Any]]
         if continue_on_error:
-
-            async def _run_parallel() -> list[dict[str, Any]]:
-                tasks = [
-                    _compare_provider(
-                        engine=engine,
-                        input_text=input_text,
-                        provider_name=provider_name,
-                        model=model,
-                        dimensions=dimensions,
-                        use_cache=not no_cache,
-                    )
-                    for provider_name in provider_names
-                ]
-                return await asyncio.gather(*tasks)
-
-            rows = asyncio.run(_run_parallel())
+            rows = run_async(
+                _run_compare(
+                    engine=engine,
+                    input_text=input_text,
+                    provider_names=provider_names,
+                    model=model,
+                    dimensions=dimensions,
+                    use_cache=not no_cache,
+                    max_concurrency=max_concurrency,
+                )
+            )
         else:
-            rows = []
-            for provider_name in provider_names:
-                row = asyncio.run(
-                    _compare_provider(
-                        engine=engine,
-                        input_text=input_text,
-                        provider_name=provider_name,
-                        model=model,
-                        dimensions=dimensions,
-                        use_cache=not no_cache,
-                    )
+            rows = run_async(
+                _run_compare_fail_fast(
+                    engine=engine,
+                    input_text=input_text,
+                    provider_names=provider_names,
+                    model=model,
+                    dimensions=dimensions,
+                    use_cache=not no_cache,
                 )
-                rows.append(row)
-                if row["status"] == "error":
-                    fail(f"Provider '{provider_name}' failed: {row['error']}", code=2)
+            )
+            if rows and rows[-1]["status"] == "error":
+                failed = rows[-1]
+                fail(f"Provider '{failed['provider']}' failed: {failed['error']}", code=2)
 
         success_count = sum(1 for row in rows if row["status"] == "ok")
 
-        ranking_result = apply_ranking(rows, rank_by)
-        successful_rows = list(ranking_result.successful_rows)
-        error_rows = list(ranking_result.error_rows)
-
-        if top is not None:
-            successful_rows = successful_rows[:top]
+        ranking_result = apply_ranking(rows, rank_by, top=top)
+        successful_rows = ranking_result.successful_rows
 
-        output_rows = list(successful_rows)
-        if include_errors:
-            output_rows.extend(error_rows)
-
-        if top is None and rank_by == "none":
-            output_rows = list(ranking_result.ranked_rows)
-            if not include_errors:
-                output_rows = [row for row in output_rows if row["status"] == "ok"]
+        if rank_by == "none":
+            # Unranked output keeps provider order; successful_rows is already that order.
+            output_rows = ranking_result.ranked_rows if include_errors else successful_rows
+        elif include_errors:
+            output_rows = successful_rows + ranking_result.error_rows
+        else:
+            output_rows = successful_rows
 
+        # Previews are only formatted for rows that survive --top / --hide-errors.
+        for row in output_rows:
+            if row["status"] == "ok":
+                row["vector_preview"] = safe_vector_preview(row["_vector"], size=6)
         public_rows = strip_private_fields(output_rows)
 
         if output_format == "csv":
@@ -235,40 +344,21 @@ def register_compare_command(app: typer.Typer) -> None:
         elif output_format == "md":
             emit_markdown(public_rows, output)
         else:
-            from rich.console import Console
             from rich.table import Table
 
             table = Table(title="Embedding comparison")
-            table.add_column("Rank")
-            table.add_column("Provider")
-            table.add_column("Status")
-            table.add_column("Model")
-            table.add_column("Dim")
-            table.add_column("Cached")
-            table.add_column("Latency ms")
-            table.add_column("Cost USD")
-            table.add_column("Quality")
-            table.add_column("Message")
-
-            for row in public_rows:
-                message = row["error"] or row["vector_preview"] or ""
-                cost = "" if row["cost_usd"] is None else f"{row['cost_usd']:.8f}"
-                quality = (
-                    "" if row["quality_score"] is None else f"{float(row['quality_score']):.6f}"
-                )
-                table.add_row(
-                    "" if row["rank"] is None else str(row["rank"]),
-                    str(row["provider"]),
-                    str(row["status"]),
-                    str(row["model"] or ""),
-                    "" if row["dimensions"] is None else str(row["dimensions"]),
-                    str(row["cached"]),
-                    f"{row['latency_ms']:.3f}",
-                    cost,
-                    quality,
-                    str(message),
-                )
-            Console(no_color=not sys.stdout.isatty()).print(table)
+            for column_name in _COMPARE_COLUMNS:
+                table.add_column(column_name)
+
+            columns = [
+                [render(row[field]) for row in public_rows] for field, render in _PRETTY_CELLS
+            ]
+            columns.append(
+                [str(row["error"] or row["vector_preview"] or "") for row in public_rows]
+            )
+            for cells in zip(*columns):
+                table.add_row(*cells)
+            get_console().print(table)
 
             if rank_by != "none" and successful_rows:
                 best = successful_rows[0]
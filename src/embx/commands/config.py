@@ -1,39 +1,53 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 from typing import Any
 
 import typer
 
-from embx.commands.shared import emit_json, fail
-from embx.config import DEFAULT_CONFIG, init_config, masked_config, resolve_config, upsert_config
-from embx.exceptions import ConfigurationError
+from embx.commands.shared import echo_menu, emit_json, fail
+
+
+def _coerce_bool(raw_value: str) -> bool:
+    normalized = raw_value.strip().lower()
+    if normalized in {"1", "true", "yes", "on"}:
+        return True
+    if normalized in {"0", "false", "no", "off"}:
+        return False
+    fail("Invalid boolean value. Use true/false.", code=2)
+
+
+def _coerce_int(raw_value: str) -> int:
+    try:
+        return int(raw_value)
+    except ValueError:
+        fail("Invalid integer value.", code=2)
+
+
+def _coerce_float(raw_value: str) -> float:
+    try:
+        return float(raw_value)
+    except ValueError:
+        fail("Invalid float value.", code=2)
+
+
+# Keyed on the exact type so bool defaults never fall through to int coercion.
+_COERCERS: dict[type, Callable[[str], Any]] = {
+    bool: _coerce_bool,
+    int: _coerce_int,
+    float: _coerce_float,
+}
 
 
 def _coerce_value(raw_value: str, sample: Any) -> Any:
-    if isinstance(sample, bool):
-        normalized = raw_value.strip().lower()
-        if normalized in {"1", "true", "yes", "on"}:
-            return True
-        if normalized in {"0", "false", "no", "off"}:
-            return False
-        fail("Invalid boolean value. Use true/false.", code=2)
-    if isinstance(sample, int):
-        try:
-            return int(raw_value)
-        except ValueError:
-            fail("Invalid integer value.", code=2)
-    if isinstance(sample, float):
-        try:
-            return float(raw_value)
-        except ValueError:
-            fail("Invalid float value.", code=2)
-    return raw_value
+    coerce = _COERCERS.get(type(sample))
+    if coerce is None:
+        return raw_value
+    return coerce(raw_value)
 
 
-def _interactive_key_choice(keys: list[str]) -> str:
-    typer.echo("Select config key:")
-    for idx, key in enumerate(keys, start=1):
-        typer.echo(f"  {idx}. {key}")
+def _interactive_key_choice(keys: Sequence[str]) -> str:
+    echo_menu("Select config key:", keys)
     raw = typer.prompt("Key number").strip()
     try:
         index = int(raw)
@@ -49,6 +63,9 @@ def register_config_commands(config_app: typer.Typer) -> None:
     def config_init(
         force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing config"),
     ) -> None:
+        from embx.config import init_config
+        from embx.exceptions import ConfigurationError
+
         try:
             path = init_config(force=force)
             typer.secho(f"Config created at {path}", fg=typer.colors.GREEN)
@@ -59,6 +76,9 @@ def register_config_commands(config_app: typer.Typer) -> None:
     def config_show(
         json_output: bool = typer.Option(False, "--json", help="Print as JSON"),
     ) -> None:
+        from embx.config import masked_config, resolve_config
+        from embx.exceptions import ConfigurationError
+
         try:
             cfg = masked_config(resolve_config())
         except ConfigurationError as exc:
@@ -80,21 +100,22 @@ def register_config_commands(config_app: typer.Typer) -> None:
             help="Fail instead of prompting for missing key/value.",
         ),
     ) -> None:
+        from embx.config import CONFIG_KEYS, DEFAULT_CONFIG, resolve_config, upsert_config
+        from embx.exceptions import ConfigurationError
+
         try:
             cfg = resolve_config()
         except ConfigurationError as exc:
             fail(str(exc), code=2)
 
-        all_keys = sorted(DEFAULT_CONFIG.keys())
-
         if key is None:
             if non_interactive:
                 fail("--key is required in non-interactive mode.", code=2)
-            key_name = _interactive_key_choice(all_keys)
+            key_name = _interactive_key_choice(CONFIG_KEYS)
         else:
             key_name = key.strip()
 
-        if key_name not in all_keys:
+        if key_name not in DEFAULT_CONFIG:
             fail(f"Unknown config key '{key_name}'.", code=2)
 
         if value is None:
@@ -1,51 +1,87 @@
 from __future__ import annotations
 
-import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import typer
 
-from embx.commands.shared import fail
-
-
-PROVIDER_ORDER = ["openai", "openrouter", "huggingface", "voyage", "ollama"]
+from embx.commands.shared import echo_menu, fail, run_connection_tests
+
+
+@dataclass(frozen=True, slots=True)
+class ProviderSetup:
+    name: str
+    key_field: str | None = None
+    base_url_field: str | None = None
+    base_url_label: str = ""
+    base_url_default: str = ""
+    intro: str | None = None
+
+
+PROVIDER_SETUPS = (
+    ProviderSetup(name="openai", key_field="openai_api_key"),
+    ProviderSetup(
+        name="openrouter",
+        key_field="openrouter_api_key",
+        base_url_field="openrouter_base_url",
+        base_url_label="OpenRouter base URL",
+        base_url_default="https://openrouter.ai/api/v1",
+    ),
+    ProviderSetup(
+        name="huggingface",
+        key_field="huggingface_api_key",
+        base_url_field="huggingface_base_url",
+        base_url_label="HuggingFace base URL",
+        base_url_default="https://router.huggingface.co/hf-inference/models",
+        intro="HuggingFace supports remote API and local cached models.",
+    ),
+    ProviderSetup(name="voyage", key_field="voyage_api_key"),
+    ProviderSetup(
+        name="ollama",
+        base_url_field="ollama_base_url",
+        base_url_label="Ollama base URL",
+        base_url_default="http://localhost:11434",
+    ),
+)
+_SETUPS_BY_NAME = {setup.name: setup for setup in PROVIDER_SETUPS}
+PROVIDER_ORDER = [setup.name for setup in PROVIDER_SETUPS]
+_KNOWN_PROVIDERS = frozenset(PROVIDER_ORDER)
 HF_MODEL_SOURCES = ("remote", "local", "all")
-PROVIDER_KEY_MAP = {
-    "openai": "openai_api_key",
-    "openrouter": "openrouter_api_key",
-    "huggingface": "huggingface_api_key",
-    "voyage": "voyage_api_key",
-}
+_HF_MODEL_SOURCE_SET = frozenset(HF_MODEL_SOURCES)
+_HF_SOURCE_BY_CHOICE = {str(index): source for index, source in enumerate(HF_MODEL_SOURCES, 1)}
+_HF_CHOICE_BY_SOURCE = {source: choice for choice, source in _HF_SOURCE_BY_CHOICE.items()}
+PROVIDER_KEY_MAP = {setup.name: setup.key_field for setup in PROVIDER_SETUPS if setup.key_field}
 
 
 def _normalize_hf_model_source(raw: str) -> str:
     source = raw.strip().lower()
-    if source not in HF_MODEL_SOURCES:
+    if source not in _HF_MODEL_SOURCE_SET:
         fail("HuggingFace model source must be one of: remote, local, all", code=2)
     return source
 
 
 def _select_hf_model_source_interactively(default_source: str) -> str:
-    normalized_default = default_source if default_source in HF_MODEL_SOURCES else "remote"
-    mapping = {"1": "remote", "2": "local", "3": "all"}
-    default_choice = {"remote": "1", "local": "2", "all": "3"}[normalized_default]
-
-    typer.echo("HuggingFace model source preference:")
-    typer.echo("  1. remote (list models from HuggingFace API)")
-    typer.echo("  2. local (list models from local HuggingFace cache)")
-    typer.echo("  3. all (combine remote and local model listings)")
+    default_choice = _HF_CHOICE_BY_SOURCE.get(default_source, "1")
+
+    echo_menu(
+        "HuggingFace model source preference:",
+        (
+            "remote (list models from HuggingFace API)",
+            "local (list models from local HuggingFace cache)",
+            "all (combine remote and local model listings)",
+        ),
+    )
 
     raw = typer.prompt("Source number", default=default_choice).strip().lower()
-    if raw in mapping:
-        return mapping[raw]
+    if raw in _HF_SOURCE_BY_CHOICE:
+        return _HF_SOURCE_BY_CHOICE[raw]
     return _normalize_hf_model_source(raw)
 
 
 def _select_provider_interactively() -> str:
-    typer.echo("Select provider:")
-    for idx, name in enumerate(PROVIDER_ORDER, start=1):
-        typer.echo(f"  {idx}. {name}")
+    echo_menu("Select provider:", PROVIDER_ORDER)
 
     raw = typer.prompt("Provider number").strip()
     try:
@@ -58,6 +94,60 @@ def _select_provider_interactively() -> str:
     return PROVIDER_ORDER[index - 1]
 
 
+def _handle_openrouter(
+    *,
+    cfg: dict[str, Any],
+    cache_dir: str | None,
+    model_source: str | None,
+    referer: str | None,
+    title: str | None,
+    non_interactive: bool,
+) -> dict[str, str]:
+    updates: dict[str, str] = {}
+    if referer is None and not non_interactive:
+        referer = typer.prompt("OpenRouter HTTP-Referer (optional)", default="").strip()
+    if title is None and not non_interactive:
+        title = typer.prompt("OpenRouter X-Title (optional)", default="").strip()
+    if referer is not None:
+        updates["openrouter_referer"] = referer
+    if title is not None:
+        updates["openrouter_title"] = title
+    return updates
+
+
+def _handle_huggingface(
+    *,
+    cfg: dict[str, Any],
+    cache_dir: str | None,
+    model_source: str | None,
+    referer: str | None,
+    title: str | None,
+    non_interactive: bool,
+) -> dict[str, str]:
+    updates: dict[str, str] = {}
+    if cache_dir is None and not non_interactive:
+        default_cache = str(cfg.get("huggingface_cache_dir", "")).strip()
+        cache_dir = typer.prompt("HuggingFace cache dir (optional)", default=default_cache).strip()
+    if cache_dir is not None:
+        updates["huggingface_cache_dir"] = cache_dir
+
+    if model_source is None:
+        default_source = str(cfg.get("huggingface_model_source", "remote")).strip().lower()
+        if non_interactive:
+            model_source = default_source
+        else:
+            model_source = _select_hf_model_source_interactively(default_source)
+    updates["huggingface_model_source"] = _normalize_hf_model_source(model_source)
+    return updates
+
+
+# Provider-specific prompts that run after the shared API key and base URL steps.
+_PROVIDER_HANDLERS: dict[str, Callable[..., dict[str, str]]] = {
+    "openrouter": _handle_openrouter,
+    "huggingface": _handle_huggingface,
+}
+
+
 def _collect_provider_updates(
     *,
     provider: str,
@@ -70,10 +160,10 @@ def _collect_provider_updates(
     title: str | None,
     non_interactive: bool,
 ) -> dict[str, str]:
+    setup = _SETUPS_BY_NAME[provider]
     updates: dict[str, str] = {}
 
-    if provider in PROVIDER_KEY_MAP:
-        key_field = PROVIDER_KEY_MAP[provider]
+    if setup.key_field is not None:
         resolved_key = api_key
         if resolved_key is None:
             if non_interactive:
@@ -84,73 +174,38 @@ def _collect_provider_updates(
             ).strip()
         if not resolved_key:
             fail("API key cannot be empty.", code=2)
-        updates[key_field] = resolved_key
-
-    if provider == "openrouter":
-        if base_url is None and not non_interactive:
-            default_base = str(cfg.get("openrouter_base_url", "https://openrouter.ai/api/v1"))
-            base_url = typer.prompt("OpenRouter base URL", default=default_base).strip()
-        if base_url:
-            updates["openrouter_base_url"] = base_url
+        updates[setup.key_field] = resolved_key
 
-        if referer is None and not non_interactive:
-            referer = typer.prompt("OpenRouter HTTP-Referer (optional)", default="").strip()
-        if title is None and not non_interactive:
-            title = typer.prompt("OpenRouter X-Title (optional)", default="").strip()
-        if referer is not None:
-            updates["openrouter_referer"] = referer
-        if title is not None:
-            updates["openrouter_title"] = title
-
-    if provider == "huggingface":
-        if not non_interactive:
-            typer.echo("HuggingFace supports remote API and local cached models.")
+    if setup.intro is not None and not non_interactive:
+        typer.echo(setup.intro)
 
+    if setup.base_url_field is not None:
         if base_url is None and not non_interactive:
-            default_base = str(
-                cfg.get("huggingface_base_url", "https://router.huggingface.co/hf-inference/models")
-            )
-            base_url = typer.prompt("HuggingFace base URL", default=default_base).strip()
+            default_base = str(cfg.get(setup.base_url_field, setup.base_url_default))
+            base_url = typer.prompt(setup.base_url_label, default=default_base).strip()
         if base_url:
-            updates["huggingface_base_url"] = base_url
-        if cache_dir is None and not non_interactive:
-            default_cache = str(cfg.get("huggingface_cache_dir", "")).strip()
-            cache_dir = typer.prompt(
-                "HuggingFace cache dir (optional)", default=default_cache
-            ).strip()
-        if cache_dir is not None:
-            updates["huggingface_cache_dir"] = cache_dir
-
-        if model_source is None:
-            default_source = str(cfg.get("huggingface_model_source", "remote")).strip().lower()
-            if non_interactive:
-                model_source = default_source
-            else:
-                model_source = _select_hf_model_source_interactively(default_source)
-        updates["huggingface_model_source"] = _normalize_hf_model_source(model_source)
+            updates[setup.base_url_field] = base_url
 
-    if provider == "ollama":
-        if base_url is None and not non_interactive:
-            default_base = str(cfg.get("ollama_base_url", "http://localhost:11434"))
-            base_url = typer.prompt("Ollama base URL", default=default_base).strip()
-        if base_url:
-            updates["ollama_base_url"] = base_url
+    handler = _PROVIDER_HANDLERS.get(provider)
+    if handler is not None:
+        updates.update(
+            handler(
+                cfg=cfg,
+                cache_dir=cache_dir,
+                model_source=model_source,
+                referer=referer,
+                title=title,
+                non_interactive=non_interactive,
+            )
+        )
 
     return updates
 
 
-def _run_connect_test(
-    provider_name: str, cfg: dict[str, Any], timeout_seconds: int
-) -> tuple[bool, str]:
-    from embx.providers.discovery import test_provider_connection
-
-    return asyncio.run(
-        test_provider_connection(
-            provider_name=provider_name,
-            config=cfg,
-            timeout_seconds=timeout_seconds,
-        )
-    )
+def _run_connect_tests(
+    provider_names: list[str], cfg: dict[str, Any], timeout_seconds: int
+) -> list[tuple[bool, str]]:
+    return run_connection_tests(provider_names, cfg, timeout_seconds)
 
 
 def register_connect_command(app: typer.Typer) -> None:
@@ -219,7 +274,7 @@ def register_connect_command(app: typer.Typer) -> None:
             help="Fail instead of prompting for missing values.",
         ),
     ) -> None:
-        from embx.config import resolve_config, upsert_config
+        from embx.config import load_file_config, resolve_config, upsert_config
 
         cfg = resolve_config()
         updates: dict[str, str] = {}
@@ -259,7 +314,7 @@ def register_connect_command(app: typer.Typer) -> None:
                 provider = _select_provider_interactively()
 
             provider = provider.strip().lower()
-            if provider not in PROVIDER_ORDER:
+            if provider not in _KNOWN_PROVIDERS:
                 available = ", ".join(PROVIDER_ORDER)
                 fail(f"Unknown provider '{provider}'. Available: {available}", code=2)
             if model_source is not None and provider != "huggingface":
@@ -282,8 +337,14 @@ def register_connect_command(app: typer.Typer) -> None:
         if set_default and configured:
             updates["default_provider"] = configured[0]
 
-        path: Path = upsert_config(updates)
-        typer.secho(f"Saved configuration to {path}", fg=typer.colors.GREEN)
+        # Compare with the file itself: resolved values may come from env vars or defaults.
+        saved = load_file_config()
+        changed = {key: value for key, value in updates.items() if saved.get(key) != value}
+        if changed:
+            path: Path = upsert_config(changed, current=saved)
+            typer.secho(f"Saved configuration to {path}", fg=typer.colors.GREEN)
+        else:
+            typer.echo("No changes: configuration file already up to date.")
         typer.echo(f"Providers configured: {', '.join(configured)}")
         if "huggingface" in configured:
             effective_hf_source = str(updates.get("huggingface_model_source", "remote"))
@@ -296,8 +357,8 @@ def register_connect_command(app: typer.Typer) -> None:
         if test:
             latest_cfg = resolve_config()
             failed: list[str] = []
-            for name in configured:
-                ok, message = _run_connect_test(name, latest_cfg, timeout_seconds)
+            results = _run_connect_tests(configured, latest_cfg, timeout_seconds)
+            for name, (ok, message) in zip(configured, results, strict=True):
                 if ok:
                     typer.secho(f"[{name}] OK: {message}", fg=typer.colors.GREEN)
                 else:
@@ -1,25 +1,75 @@
 from __future__ import annotations
 
-import asyncio
-import sys
 from typing import Any
 
 import typer
 
-from embx.commands.shared import check_ollama_endpoint, emit_json, fail, is_provider_configured
+from embx.commands.shared import (
+    check_endpoints,
+    configured_provider_names,
+    emit_json,
+    fail,
+    get_console,
+    probe_connections,
+    run_async,
+)
+
+
+# (row field, table header) pairs; JSON rows keep native types, the table stringifies.
+_ROW_COLUMNS = (
+    ("provider", "Provider"),
+    ("configured", "Configured"),
+    ("required", "Required"),
+    ("network_status", "Network"),
+    ("network_detail", "Network Detail"),
+    ("auth_status", "Auth"),
+    ("auth_detail", "Auth Detail"),
+)
+_FIX_COLUMNS = (
+    ("needs_fix", "Needs Fix"),
+    ("suggestion", "Suggestion"),
+)
+_KEYED_PROVIDERS = frozenset({"openai", "openrouter", "huggingface", "voyage"})
+
+
+def _run_checks(
+    auth_names: list[str],
+    base_urls: list[str],
+    config: dict[str, Any],
+    timeout_seconds: int,
+) -> tuple[list[tuple[bool, str]], list[tuple[str, str]]]:
+    """Run auth and network probes together, on one loop and one HTTP client."""
+    import asyncio
+
+    from embx.providers.base import shared_http_client
+
+    async def run_all() -> tuple[list[tuple[bool, str]], list[tuple[str, str]]]:
+        async with shared_http_client(timeout_seconds):
+            auth, network = await asyncio.gather(
+                probe_connections(auth_names, config, timeout_seconds),
+                check_endpoints(base_urls, timeout_seconds),
+            )
+        return auth, network
+
+    return run_async(run_all())
 
 
-def _build_fix_suggestion(provider_name: str, row: dict[str, Any]) -> str:
-    if not bool(row.get("configured", False)):
-        required = str(row.get("required", ""))
-        if required and required != "none":
-            return f"Run: embx connect --provider {provider_name} --test"
+def _build_fix_suggestion(
+    provider_name: str,
+    *,
+    configured: bool,
+    required: str,
+    network_status: str,
+    auth_status: str,
+) -> str:
+    if not configured and required and required != "none":
+        return f"Run: embx connect --provider {provider_name} --test"
 
-    if str(row.get("network_status", "")) == "error" and provider_name == "ollama":
+    if network_status == "error" and provider_name == "ollama":
         return "Check Ollama base URL and service, then run: embx connect --provider ollama --test"
 
-    if str(row.get("auth_status", "")) == "error":
-        if provider_name in {"openai", "openrouter", "huggingface", "voyage"}:
+    if auth_status == "error":
+        if provider_name in _KEYED_PROVIDERS:
             return f"Refresh API key with: embx connect --provider {provider_name} --test"
         if provider_name == "ollama":
             return "Ensure Ollama is running and the model is installed."
@@ -61,26 +111,50 @@ def register_doctor_command(app: typer.Typer) -> None:
         from embx.config import resolve_config
         from embx.exceptions import ConfigurationError
         from embx.providers import available_provider_metadata
-        from embx.providers.discovery import test_provider_connection
 
         try:
             cfg = resolve_config()
         except ConfigurationError as exc:
             fail(str(exc), code=2)
 
+        metadata_list = available_provider_metadata()
+        configured_names = configured_provider_names(
+            [metadata["name"] for metadata in metadata_list], cfg
+        )
+        candidates: list[tuple[dict[str, str], bool]] = []
+        for metadata in metadata_list:
+            configured = metadata["name"] in configured_names
+            if only_configured and not configured:
+                continue
+            candidates.append((metadata, configured))
+
+        auth_names: list[str] = []
+        if check_auth:
+            auth_names = [metadata["name"] for metadata, configured in candidates if configured]
+        # Only Ollama has a cheap reachability probe today; the rest rely on --check-auth.
+        network_targets: dict[str, str] = {}
+        if check_network:
+            network_targets = {
+                metadata["name"]: str(cfg.get("ollama_base_url", "http://localhost:11434"))
+                for metadata, _ in candidates
+                if metadata["name"] == "ollama"
+            }
+
+        auth_results: dict[str, tuple[bool, str]] = {}
+        network_results: dict[str, tuple[str, str]] = {}
+        if auth_names or network_targets:
+            auth_list, network_list = _run_checks(
+                auth_names, list(network_targets.values()), cfg, timeout_seconds
+            )
+            auth_results = dict(zip(auth_names, auth_list, strict=True))
+            network_results = dict(zip(network_targets, network_list, strict=True))
+
         rows: list[dict[str, Any]] = []
         issues_count = 0
-        for metadata in available_provider_metadata():
+        for metadata, configured in candidates:
             provider_name = metadata["name"]
-            configured = is_provider_configured(provider_name, cfg)
-            if only_configured and not configured:
-                continue
 
-            network_status = "skipped"
-            network_detail = ""
-            if check_network and provider_name == "ollama":
-                base_url = str(cfg.get("ollama_base_url", "http://localhost:11434"))
-                network_status, network_detail = check_ollama_endpoint(base_url, timeout_seconds)
+            network_status, network_detail = network_results.get(provider_name, ("skipped", ""))
 
             auth_status = "skipped"
             auth_detail = ""
@@ -89,13 +163,7 @@ def register_doctor_command(app: typer.Typer) -> None:
                     auth_status = "skipped"
                     auth_detail = "provider not configured"
                 else:
-                    ok, message = asyncio.run(
-                        test_provider_connection(
-                            provider_name=provider_name,
-                            config=cfg,
-                            timeout_seconds=timeout_seconds,
-                        )
-                    )
+                    ok, message = auth_results[provider_name]
                     auth_status = "ok" if ok else "error"
                     auth_detail = message
 
@@ -110,7 +178,13 @@ def register_doctor_command(app: typer.Typer) -> None:
             }
 
             if fix:
-                suggestion = _build_fix_suggestion(provider_name, row)
+                suggestion = _build_fix_suggestion(
+                    provider_name,
+                    configured=configured,
+                    required=metadata["requires"],
+                    network_status=network_status,
+                    auth_status=auth_status,
+                )
                 row["suggestion"] = suggestion
                 row["needs_fix"] = bool(suggestion)
                 if suggestion:
@@ -127,34 +201,16 @@ def register_doctor_command(app: typer.Typer) -> None:
                 raise typer.Exit(code=3)
             return
 
-        from rich.console import Console
         from rich.table import Table
 
+        columns = _ROW_COLUMNS + _FIX_COLUMNS if fix else _ROW_COLUMNS
+        fields = [field for field, _ in columns]
         table = Table(title="embx doctor")
-        table.add_column("Provider")
-        table.add_column("Configured")
-        table.add_column("Required")
-        table.add_column("Network")
-        table.add_column("Network Detail")
-        table.add_column("Auth")
-        table.add_column("Auth Detail")
-        if fix:
-            table.add_column("Needs Fix")
-            table.add_column("Suggestion")
+        for _, header in columns:
+            table.add_column(header)
         for row in rows:
-            cells = [
-                str(row["provider"]),
-                str(row["configured"]),
-                str(row["required"]),
-                str(row["network_status"]),
-                str(row["network_detail"]),
-                str(row["auth_status"]),
-                str(row["auth_detail"]),
-            ]
-            if fix:
-                cells.extend([str(row["needs_fix"]), str(row["suggestion"])])
-            table.add_row(*cells)
-        Console(no_color=not sys.stdout.isatty()).print(table)
+            table.add_row(*[str(row[field]) for field in fields])
+        get_console().print(table)
 
         if fix and issues_count > 0:
             typer.secho(
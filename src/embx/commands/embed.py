@@ -1,12 +1,21 @@
 from __future__ import annotations
 
-import asyncio
-import sys
 from pathlib import Path
 
 import typer
 
-from embx.commands.shared import collect_single_text, emit_csv, emit_json, fail, safe_vector_preview
+from embx.commands.shared import (
+    collect_single_text,
+    emit_csv,
+    emit_json,
+    fail,
+    get_console,
+    run_async,
+    safe_vector_preview,
+)
+
+
+_OUTPUT_FORMATS = frozenset(("pretty", "json", "csv"))
 
 
 def register_embed_command(app: typer.Typer) -> None:
@@ -34,13 +43,13 @@ def register_embed_command(app: typer.Typer) -> None:
             help="Initial retry backoff in seconds",
         ),
     ) -> None:
+        if output_format not in _OUTPUT_FORMATS:
+            fail("--format must be one of: pretty, json, csv", code=2)
+
         from embx.config import resolve_config
-        from embx.engine import EmbeddingEngine
+        from embx.engine import get_engine
         from embx.exceptions import ConfigurationError, ProviderError, ValidationError
 
-        if output_format not in {"pretty", "json", "csv"}:
-            fail("--format must be one of: pretty, json, csv", code=2)
-
         try:
             input_text = collect_single_text(text)
             overrides = {
@@ -51,9 +60,9 @@ def register_embed_command(app: typer.Typer) -> None:
             }
             cfg = resolve_config(overrides)
             provider_name = provider or str(cfg.get("default_provider"))
-            engine = EmbeddingEngine(cfg)
+            engine = get_engine(cfg)
 
-            results = asyncio.run(
+            results = run_async(
                 engine.embed_texts(
                     texts=[input_text],
                     provider_name=provider_name,
@@ -74,7 +83,6 @@ def register_embed_command(app: typer.Typer) -> None:
             emit_json(payload, output)
             return
 
-        from rich.console import Console
         from rich.table import Table
 
         table = Table(title="Embedding")
@@ -89,4 +97,4 @@ def register_embed_command(app: typer.Typer) -> None:
         if result.cost_usd is not None:
             table.add_row("cost_usd", f"{result.cost_usd:.8f}")
         table.add_row("vector_preview", safe_vector_preview(result.vector))
-        Console(no_color=not sys.stdout.isatty()).print(table)
+        get_console().print(table)
@@ -1,22 +1,28 @@
 from __future__ import annotations
 
-import asyncio
-import sys
 from pathlib import Path
 from typing import Any
 
 import typer
 
-from embx.commands.shared import emit_csv, emit_json, emit_markdown, fail
+from embx.commands.shared import (
+    echo_menu,
+    emit_csv,
+    emit_json,
+    emit_markdown,
+    fail,
+    get_console,
+    normalize_model_rows,
+    run_async,
+)
 
 
+_OUTPUT_FORMATS = frozenset(("pretty", "json", "csv", "md"))
 MODEL_SOURCES = ("remote", "local", "all")
 
 
 def _select_provider_interactively(options: list[str]) -> str:
-    typer.echo("Select provider for model discovery:")
-    for idx, name in enumerate(options, start=1):
-        typer.echo(f"  {idx}. {name}")
+    echo_menu("Select provider for model discovery:", options)
 
     raw = typer.prompt("Provider number").strip()
     try:
@@ -29,10 +35,7 @@ def _select_provider_interactively(options: list[str]) -> str:
 
 
 def _select_source_interactively(default_source: str = "remote") -> str:
-    typer.echo("Choose model source:")
-    typer.echo("  1. remote")
-    typer.echo("  2. local")
-    typer.echo("  3. all")
+    echo_menu("Choose model source:", MODEL_SOURCES)
     default_map = {"remote": "1", "local": "2", "all": "3"}
     default_choice = default_map.get(default_source, "1")
     raw = typer.prompt("Source number", default=default_choice).strip().lower()
@@ -43,49 +46,18 @@ def _select_source_interactively(default_source: str = "remote") -> str:
     return selected
 
 
-def _normalize_model_rows(
-    provider_name: str, raw_models: list[dict[str, Any]]
-) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    for row in raw_models:
-        model_id = str(row.get("id") or row.get("name") or row.get("model") or "")
-        if not model_id:
-            continue
-        display_name = str(row.get("name") or model_id)
-        context_length = (
-            row.get("context_length") or row.get("max_input_tokens") or row.get("num_ctx")
-        )
-        dimensions = (
-            row.get("embedding_dimension")
-            or row.get("dimensions")
-            or row.get("dim")
-            or row.get("size")
-        )
-        rows.append(
-            {
-                "provider": provider_name,
-                "id": model_id,
-                "name": display_name,
-                "source": str(row.get("source", "remote")),
-                "local_path": str(row.get("local_path", "")),
-                "context_length": context_length,
-                "dimensions": dimensions,
-            }
-        )
-    return rows
-
-
 def _filter_rows(
     rows: list[dict[str, Any]], search: str | None, limit: int | None
 ) -> list[dict[str, Any]]:
     filtered = rows
     if search:
         pattern = search.lower()
+        # Normalized rows always carry string id/name; name often repeats the id.
         filtered = [
             row
             for row in filtered
-            if pattern in str(row.get("id", "")).lower()
-            or pattern in str(row.get("name", "")).lower()
+            if pattern in (model_id := row["id"]).lower()
+            or (row["name"] != model_id and pattern in row["name"].lower())
         ]
     if limit is not None:
         filtered = filtered[:limit]
@@ -93,9 +65,7 @@ def _filter_rows(
 
 
 def _choose_row_interactively(rows: list[dict[str, Any]]) -> dict[str, Any]:
-    typer.echo("Select model:")
-    for idx, row in enumerate(rows, start=1):
-        typer.echo(f"  {idx}. {row['id']}")
+    echo_menu("Select model:", (row["id"] for row in rows))
 
     raw = typer.prompt("Model number").strip()
     try:
@@ -128,6 +98,11 @@ def register_models_command(app: typer.Typer) -> None:
         output_format: str = typer.Option("pretty", "--format", help="pretty, json, csv, or md"),
         output: Path | None = typer.Option(None, "--output", "-o", help="Write output to file"),
         timeout_seconds: int = typer.Option(10, "--timeout-seconds", min=1, help="Request timeout"),
+        no_cache: bool = typer.Option(
+            False,
+            "--no-cache",
+            help="Ignore the on-disk model listing cache and fetch fresh results.",
+        ),
         choose: bool = typer.Option(
             False,
             "--choose",
@@ -157,10 +132,10 @@ def register_models_command(app: typer.Typer) -> None:
     ) -> None:
         from embx.config import resolve_config
         from embx.exceptions import ConfigurationError, ProviderError, ValidationError
-        from embx.providers import available_provider_metadata
-        from embx.providers.discovery import list_embedding_models
+        from embx.providers import available_provider_metadata, available_provider_names
+        from embx.providers.discovery import list_embedding_models_cached
 
-        if output_format not in {"pretty", "json", "csv", "md"}:
+        if output_format not in _OUTPUT_FORMATS:
             fail("--format must be one of: pretty, json, csv, md", code=2)
         if interactive and non_interactive:
             fail("--interactive and --non-interactive cannot be used together.", code=2)
@@ -176,18 +151,18 @@ def register_models_command(app: typer.Typer) -> None:
         except ConfigurationError as exc:
             fail(str(exc), code=2)
 
-        options = [row["name"] for row in available_provider_metadata()]
-
         provider_name: str
         if provider is not None:
             provider_name = provider.strip().lower()
         elif interactive:
+            options = [row["name"] for row in available_provider_metadata()]
             provider_name = _select_provider_interactively(options)
         else:
             provider_name = str(cfg.get("default_provider", "openai")).strip().lower()
 
-        if provider_name not in options:
-            fail(f"Unknown provider '{provider_name}'. Available: {', '.join(options)}", code=2)
+        if provider_name not in available_provider_names():
+            available = ", ".join(sorted(available_provider_names()))
+            fail(f"Unknown provider '{provider_name}'. Available: {available}", code=2)
 
         if source is None:
             if provider_name == "huggingface":
@@ -210,18 +185,22 @@ def register_models_command(app: typer.Typer) -> None:
             search = typer.prompt("Search text (optional)", default="").strip() or None
 
         try:
-            raw_models = asyncio.run(
-                list_embedding_models(
+            raw_models = run_async(
+                list_embedding_models_cached(
                     provider_name=provider_name,
                     config=cfg,
                     timeout_seconds=timeout_seconds,
                     source=source_name,
+                    ttl_seconds=float(cfg.get("models_cache_ttl_seconds", 3600)),
+                    use_cache=not no_cache,
+                    # Without --search the pick index is known before filtering.
+                    max_rows=pick if pick is not None and not search else None,
                 )
             )
         except (ConfigurationError, ProviderError, ValidationError) as exc:
             fail(str(exc), code=2)
 
-        rows = _normalize_model_rows(provider_name, raw_models)
+        rows = normalize_model_rows(provider_name, raw_models)
         rows = _filter_rows(rows, search=search, limit=limit)
 
         if choose or pick is not None:
@@ -262,7 +241,6 @@ def register_models_command(app: typer.Typer) -> None:
             emit_markdown(rows, output)
             return
 
-        from rich.console import Console
         from rich.table import Table
 
         table = Table(title=f"Embedding models ({provider_name}, {source_name})")
@@ -272,13 +250,18 @@ def register_models_command(app: typer.Typer) -> None:
         table.add_column("Context")
         table.add_column("Dimensions")
         table.add_column("Local Path")
-        for row in rows:
-            table.add_row(
-                str(row["id"]),
-                str(row["name"]),
-                str(row["source"]),
+        # normalize_model_rows already stores id, name, source and local_path as str.
+        cells = [
+            (
+                row["id"],
+                row["name"],
+                row["source"],
                 "" if row["context_length"] is None else str(row["context_length"]),
                 "" if row["dimensions"] is None else str(row["dimensions"]),
-                str(row["local_path"]),
+                row["local_path"],
             )
-        Console(no_color=not sys.stdout.isatty()).print(table)
+            for row in rows
+        ]
+        for row_cells in cells:
+            table.add_row(*row_cells)
+        get_console().print(table)
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-import asyncio
-import sys
 import time
 from pathlib import Path
 
 import typer
 
-from embx.commands.shared import emit_csv, emit_json, emit_markdown, fail
+from embx.commands.shared import (
+    emit_csv,
+    emit_json,
+    emit_markdown,
+    fail,
+    get_console,
+    run_async,
+)
+
+
+_OUTPUT_FORMATS = frozenset(("pretty", "json", "csv", "md"))
 
 
 def register_ping_command(app: typer.Typer) -> None:
@@ -43,13 +51,13 @@ def register_ping_command(app: typer.Typer) -> None:
             help="Request timeout override",
         ),
     ) -> None:
+        if output_format not in _OUTPUT_FORMATS:
+            fail("--format must be one of: pretty, json, csv, md", code=2)
+
         from embx.config import resolve_config
-        from embx.engine import EmbeddingEngine
+        from embx.engine import get_engine
         from embx.exceptions import ConfigurationError, ProviderError, ValidationError
 
-        if output_format not in {"pretty", "json", "csv", "md"}:
-            fail("--format must be one of: pretty, json, csv, md", code=2)
-
         try:
             cfg = resolve_config(
                 {
@@ -64,11 +72,11 @@ def register_ping_command(app: typer.Typer) -> None:
             fail(str(exc), code=2)
 
         provider_name = provider or str(cfg.get("default_provider", "openai"))
-        engine = EmbeddingEngine(cfg)
+        engine = get_engine(cfg)
 
         started = time.perf_counter()
         try:
-            result = asyncio.run(
+            result = run_async(
                 engine.embed_texts(
                     texts=[text],
                     provider_name=provider_name,
@@ -102,7 +110,6 @@ def register_ping_command(app: typer.Typer) -> None:
             emit_markdown([row], output)
             return
 
-        from rich.console import Console
         from rich.table import Table
 
         table = Table(title="embx ping")
@@ -120,4 +127,4 @@ def register_ping_command(app: typer.Typer) -> None:
         ]:
             value = row[key]
             table.add_row(key, "" if value is None else str(value))
-        Console(no_color=not sys.stdout.isatty()).print(table)
+        get_console().print(table)
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-import sys
-
 import typer
 
-from embx.commands.shared import emit_json
+from embx.commands.shared import emit_json, get_console
 
 
 def register_providers_command(app: typer.Typer) -> None:
@@ -20,10 +18,9 @@ def register_providers_command(app: typer.Typer) -> None:
             emit_json(rows)
             return
 
-        from rich.console import Console
         from rich.table import Table
 
-        console = Console(no_color=not sys.stdout.isatty())
+        console = get_console()
         table = Table(title="Available providers")
         table.add_column("Provider")
         table.add_column("Default Model")
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import asyncio
-import sys
 from pathlib import Path
 from time import perf_counter
 from typing import Any
@@ -11,21 +9,24 @@ import typer
 from embx.commands.shared import (
     all_provider_names,
     collect_single_text,
+    echo_menu,
     emit_csv,
     emit_json,
     fail,
+    get_console,
     is_provider_configured,
+    normalize_model_rows,
+    run_async,
     safe_vector_preview,
 )
 
 
+_OUTPUT_FORMATS = frozenset(("pretty", "json", "csv"))
 MODEL_SOURCES = ("remote", "local", "all")
 
 
 def _select_provider_interactively(options: list[str]) -> str:
-    typer.echo("Select provider:")
-    for idx, name in enumerate(options, start=1):
-        typer.echo(f"  {idx}. {name}")
+    echo_menu("Select provider:", options)
 
     raw = typer.prompt("Provider number").strip()
     try:
@@ -42,10 +43,14 @@ def _select_hf_source_interactively(default_source: str) -> str:
     source_map = {"remote": "1", "local": "2", "all": "3"}
     default_choice = source_map.get(default_source, "1")
 
-    typer.echo("Choose HuggingFace model source:")
-    typer.echo("  1. remote (models from HuggingFace API)")
-    typer.echo("  2. local (models from local cache)")
-    typer.echo("  3. all (combined remote and local)")
+    echo_menu(
+        "Choose HuggingFace model source:",
+        (
+            "remote (models from HuggingFace API)",
+            "local (models from local cache)",
+            "all (combined remote and local)",
+        ),
+    )
 
     raw = typer.prompt("Source number", default=default_choice).strip().lower()
     mapping = {"1": "remote", "2": "local", "3": "all"}
@@ -55,26 +60,8 @@ def _select_hf_source_interactively(default_source: str) -> str:
     return selected
 
 
-def _normalize_model_rows(raw_models: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    for row in raw_models:
-        model_id = str(row.get("id") or row.get("name") or row.get("model") or "")
-        if not model_id:
-            continue
-        rows.append(
-            {
-                "id": model_id,
-                "name": str(row.get("name") or model_id),
-                "source": str(row.get("source", "remote")),
-            }
-        )
-    return rows
-
-
 def _select_model_interactively(rows: list[dict[str, Any]]) -> str:
-    typer.echo("Select model:")
-    for idx, row in enumerate(rows, start=1):
-        typer.echo(f"  {idx}. {row['id']} ({row['source']})")
+    echo_menu("Select model:", (f"{row['id']} ({row['source']})" for row in rows))
 
     raw = typer.prompt("Model number").strip()
     try:
@@ -171,15 +158,11 @@ def register_quickstart_command(app: typer.Typer) -> None:
             help="Fail instead of prompting for missing values.",
         ),
     ) -> None:
-        from embx.commands.connect import _collect_provider_updates
+        if output_format not in _OUTPUT_FORMATS:
+            fail("--format must be one of: pretty, json, csv", code=2)
+
         from embx.config import resolve_config, upsert_config
-        from embx.engine import EmbeddingEngine
         from embx.exceptions import ConfigurationError, ProviderError, ValidationError
-        from embx.providers import get_provider
-        from embx.providers.discovery import list_embedding_models
-
-        if output_format not in {"pretty", "json", "csv"}:
-            fail("--format must be one of: pretty, json, csv", code=2)
 
         cfg = resolve_config()
         providers = all_provider_names()
@@ -215,6 +198,8 @@ def register_quickstart_command(app: typer.Typer) -> None:
                 fail("Cannot continue without provider setup.", code=2)
 
         if should_connect:
+            from embx.commands.connect import _collect_provider_updates
+
             updates = _collect_provider_updates(
                 provider=provider_name,
                 cfg=cfg,
@@ -251,13 +236,25 @@ def register_quickstart_command(app: typer.Typer) -> None:
 
         selected_model = model
         if not selected_model:
+            from embx.providers import get_provider
+            from embx.providers.discovery import (
+                list_embedding_models_cached,
+                model_discovery_disabled,
+            )
+
             try:
-                raw_models = asyncio.run(
-                    list_embedding_models(
-                        provider_name=provider_name,
-                        config=cfg,
-                        timeout_seconds=timeout_seconds,
-                        source=source_name,
+                raw_models = (
+                    []
+                    if model_discovery_disabled()
+                    else run_async(
+                        list_embedding_models_cached(
+                            provider_name=provider_name,
+                            config=cfg,
+                            timeout_seconds=timeout_seconds,
+                            source=source_name,
+                            ttl_seconds=float(cfg.get("models_cache_ttl_seconds", 3600)),
+                            use_cache=not no_cache,
+                        )
                     )
                 )
             except (ConfigurationError, ProviderError, ValidationError) as exc:
@@ -269,7 +266,7 @@ def register_quickstart_command(app: typer.Typer) -> None:
                         err=True,
                     )
 
-            rows = _normalize_model_rows(raw_models)
+            rows = normalize_model_rows(provider_name, raw_models)
             if rows:
                 if non_interactive:
                     selected_model = str(rows[0]["id"])
@@ -284,11 +281,13 @@ def register_quickstart_command(app: typer.Typer) -> None:
             upsert_config({"default_provider": provider_name, "default_model": selected_model})
             cfg = resolve_config()
 
+        from embx.engine import get_engine
+
         try:
             input_text = collect_single_text(text)
-            engine = EmbeddingEngine(cfg)
+            engine = get_engine(cfg)
             started = perf_counter()
-            result = asyncio.run(
+            result = run_async(
                 engine.embed_texts(
                     texts=[input_text],
                     provider_name=provider_name,
@@ -311,7 +310,6 @@ def register_quickstart_command(app: typer.Typer) -> None:
             emit_json(payload, output)
             return
 
-        from rich.console import Console
         from rich.table import Table
 
         table = Table(title="Quickstart embedding")
@@ -327,4 +325,4 @@ def register_quickstart_command(app: typer.Typer) -> None:
         if result.cost_usd is not None:
             table.add_row("cost_usd", f"{result.cost_usd:.8f}")
         table.add_row("vector_preview", safe_vector_preview(result.vector))
-        Console(no_color=not sys.stdout.isatty()).print(table)
+        get_console().print(table)
@@ -1,27 +1,109 @@
 from __future__ import annotations
 
 import csv
-import io
 import json
 import sys
+from collections.abc import Coroutine, Iterable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, NoReturn
+from typing import Any, NoReturn, TextIO, TypeVar
 
-import httpx
 import typer
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+T = TypeVar("T")
+
+_async_runner: Any = None
+
 
 def fail(message: str, code: int = 1) -> NoReturn:
     typer.secho(f"Error: {message}", fg=typer.colors.RED, err=True)
     raise typer.Exit(code=code)
 
 
+def echo_menu(title: str, options: Iterable[str]) -> None:
+    """Print a numbered menu in a single write rather than one echo per line."""
+    lines = [title]
+    lines.extend(f"  {idx}. {option}" for idx, option in enumerate(options, start=1))
+    typer.echo("\n".join(lines))
+
+
+def _event_loop_factory() -> Any:
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional speedup
+        return None
+    return uvloop.new_event_loop
+
+
+def _get_async_runner() -> Any:
+    global _async_runner
+    if _async_runner is None:
+        import asyncio
+        import atexit
+
+        loop_factory = _event_loop_factory()
+        if sys.version_info >= (3, 11):
+            _async_runner = asyncio.Runner(loop_factory=loop_factory)
+        else:  # pragma: no cover - Python 3.10 fallback
+            loop = (loop_factory or asyncio.new_event_loop)()
+            _async_runner = _LoopRunner(loop)
+        atexit.register(_close_async_runner, _async_runner)
+    return _async_runner
+
+
+def _close_async_runner(runner: Any) -> None:
+    # Engines keep pooled HTTP clients on this loop; close them before the loop goes away.
+    engine_module = sys.modules.get("embx.engine")
+    if engine_module is not None:
+        runner.run(engine_module.close_engines())
+    runner.close()
+
+
+class _LoopRunner:
+    def __init__(self, loop: Any) -> None:
+        self._loop = loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        return self._loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        self._loop.close()
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on an event loop that is reused for the whole process."""
+    return _get_async_runner().run(coro)
+
+
+@lru_cache(maxsize=1)
+def get_console() -> Any:
+    """Return the process-wide Rich console; it resolves sys.stdout on every print."""
+    from rich.console import Console
+
+    return Console(no_color=not sys.stdout.isatty())
+
+
 def collect_single_text(maybe_text: str | None) -> str:
     if maybe_text:
         return maybe_text
 
     if not sys.stdin.isatty():
-        piped = sys.stdin.read().strip()
+        stdin_bytes = getattr(sys.stdin, "buffer", None)
+        if stdin_bytes is None:
+            piped = sys.stdin.read().strip()
+        else:
+            try:
+                piped = stdin_bytes.read().decode("utf-8").strip()
+            except UnicodeDecodeError:
+                fail("Input on stdin is not valid UTF-8.", code=2)
         if piped:
             return piped
         fail("No input found on stdin.", code=2)
@@ -29,56 +111,87 @@ def collect_single_text(maybe_text: str | None) -> str:
     return typer.prompt("Text to embed").strip()
 
 
+@lru_cache(maxsize=32)
+def _preview_template(count: int, truncated: bool) -> str:
+    suffix = " ..." if truncated else ""
+    return "[" + ", ".join(["{:.5f}"] * count) + suffix + "]"
+
+
 def safe_vector_preview(vector: list[float], size: int = 8) -> str:
     items = vector[:size]
-    rendered = ", ".join(f"{value:.5f}" for value in items)
-    suffix = " ..." if len(vector) > size else ""
-    return f"[{rendered}{suffix}]"
+    return _preview_template(len(items), len(vector) > size).format(*items)
 
 
-def emit_json(data: Any, output: Path | None = None) -> None:
-    serialized = json.dumps(data, indent=2)
-    if output:
-        output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(serialized + "\n", encoding="utf-8")
-        typer.secho(f"Wrote output to {output}", fg=typer.colors.GREEN, err=True)
-        return
-    typer.echo(serialized)
+def dumps_json(data: Any) -> str:
+    # Same layout and UTF-8 text either way; only float spelling differs (see dumps_json_line).
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False)
 
 
-def emit_csv(rows: list[dict[str, Any]], output: Path | None = None) -> None:
-    fieldnames: list[str] = []
+def dumps_json_line(data: Any) -> bytes:
+    # Compact, UTF-8 lines either way, matching orjson's only output form. Float spelling
+    # still differs (orjson `0.000012` vs stdlib `1.2e-05`); the parsed values are equal.
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def iter_json_array(rows: Iterable[Any]) -> Iterator[str]:
+    """Yield `dumps_json(list(rows))` in pieces, one row at a time."""
+    yield "["
+    separator = "\n  "
     for row in rows:
-        for key in row.keys():
-            if key not in fieldnames:
-                fieldnames.append(key)
+        yield separator
+        yield dumps_json(row).replace("\n", "\n  ")
+        separator = ",\n  "
+    yield "]" if separator == "\n  " else "\n]"
+
+
+@contextmanager
+def _output_stream(output: Path | None) -> Iterator[TextIO]:
+    if output is None:
+        yield sys.stdout
+        sys.stdout.flush()
+        return
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("w", encoding="utf-8", newline="") as handle:
+        yield handle
+    typer.secho(f"Wrote output to {output}", fg=typer.colors.GREEN, err=True)
+
+
+def emit_json(data: Any, output: Path | None = None) -> None:
+    with _output_stream(output) as handle:
+        if isinstance(data, list):
+            handle.writelines(iter_json_array(data))
+        else:
+            handle.write(dumps_json(data))
+        handle.write("\n")
+
+
+def _collect_fieldnames(rows: list[dict[str, Any]]) -> list[str]:
+    # dict.fromkeys keeps first-seen order with O(1) membership checks.
+    return list(dict.fromkeys(chain.from_iterable(rows)))
+
+
+def _project_columns(rows: list[dict[str, Any]], fieldnames: list[str]) -> list[list[Any]]:
+    return [[row.get(key, "") for row in rows] for key in fieldnames]
 
+
+def emit_csv(rows: list[dict[str, Any]], output: Path | None = None) -> None:
+    fieldnames = _collect_fieldnames(rows)
     if not fieldnames:
         fieldnames = ["result"]
         rows = [{"result": ""}]
 
-    buffer = io.StringIO()
-    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
-    writer.writeheader()
-    for row in rows:
-        writer.writerow(row)
-    payload = buffer.getvalue()
-
-    if output:
-        output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(payload, encoding="utf-8")
-        typer.secho(f"Wrote output to {output}", fg=typer.colors.GREEN, err=True)
-        return
-    typer.echo(payload, nl=False)
+    with _output_stream(output) as handle:
+        writer = csv.writer(handle)
+        writer.writerow(fieldnames)
+        writer.writerows(zip(*_project_columns(rows, fieldnames)))
 
 
 def emit_markdown(rows: list[dict[str, Any]], output: Path | None = None) -> None:
-    fieldnames: list[str] = []
-    for row in rows:
-        for key in row.keys():
-            if key not in fieldnames:
-                fieldnames.append(key)
-
+    fieldnames = _collect_fieldnames(rows)
     if not fieldnames:
         fieldnames = ["result"]
         rows = [{"result": ""}]
@@ -87,20 +200,40 @@ def emit_markdown(rows: list[dict[str, Any]], output: Path | None = None) -> Non
         text = str(value)
         return text.replace("|", "\\|").replace("\n", "<br>")
 
-    header = "| " + " | ".join(fieldnames) + " |"
-    divider = "| " + " | ".join("---" for _ in fieldnames) + " |"
-    lines = [header, divider]
-    for row in rows:
-        line = "| " + " | ".join(_escape(row.get(key, "")) for key in fieldnames) + " |"
-        lines.append(line)
-
-    payload = "\n".join(lines) + "\n"
-    if output:
-        output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(payload, encoding="utf-8")
-        typer.secho(f"Wrote output to {output}", fg=typer.colors.GREEN, err=True)
-        return
-    typer.echo(payload, nl=False)
+    columns = [
+        [_escape(value) for value in column] for column in _project_columns(rows, fieldnames)
+    ]
+    with _output_stream(output) as handle:
+        handle.write("| " + " | ".join(fieldnames) + " |\n")
+        handle.write("| " + " | ".join("---" for _ in fieldnames) + " |\n")
+        handle.writelines("| " + " | ".join(cells) + " |\n" for cells in zip(*columns))
+
+
+# Provider payloads name the same field differently; the first truthy key wins.
+_CONTEXT_KEYS = ("context_length", "max_input_tokens", "num_ctx")
+_DIMENSION_KEYS = ("embedding_dimension", "dimensions", "dim", "size")
+
+
+def _first_present(row: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    return next((value for key in keys if (value := row.get(key))), None)
+
+
+def normalize_model_rows(
+    provider_name: str, raw_models: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    return [
+        {
+            "provider": provider_name,
+            "id": model_id,
+            "name": str(row.get("name") or model_id),
+            "source": str(row.get("source", "remote")),
+            "local_path": str(row.get("local_path", "")),
+            "context_length": _first_present(row, _CONTEXT_KEYS),
+            "dimensions": _first_present(row, _DIMENSION_KEYS),
+        }
+        for row in raw_models
+        if (model_id := str(row.get("id") or row.get("name") or row.get("model") or ""))
+    ]
 
 
 def all_provider_names() -> list[str]:
@@ -136,14 +269,86 @@ def is_provider_configured(provider_name: str, config: dict[str, Any]) -> bool:
     return all(str(config.get(key, "")).strip() for key in required_keys)
 
 
-def check_ollama_endpoint(base_url: str, timeout_seconds: int) -> tuple[str, str]:
+def configured_provider_names(provider_names: list[str], config: dict[str, Any]) -> set[str]:
+    from embx.providers import get_provider
+
+    present_keys = frozenset(key for key, value in config.items() if str(value).strip())
+    return {
+        provider_name
+        for provider_name in provider_names
+        if present_keys.issuperset(getattr(get_provider(provider_name), "required_config_keys", ()))
+    }
+
+
+async def probe_connections(
+    provider_names: list[str],
+    config: dict[str, Any],
+    timeout_seconds: int,
+    max_concurrency: int = 8,
+) -> list[tuple[bool, str]]:
+    """Probe providers concurrently; results follow `provider_names` order."""
+    import asyncio
+
+    from embx.providers import discovery
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def probe(provider_name: str) -> tuple[bool, str]:
+        async with semaphore:
+            return await discovery.test_provider_connection(
+                provider_name=provider_name,
+                config=config,
+                timeout_seconds=timeout_seconds,
+            )
+
+    results = await asyncio.gather(
+        *(probe(provider_name) for provider_name in provider_names),
+        return_exceptions=True,
+    )
+    return [
+        (False, str(result)) if isinstance(result, BaseException) else result for result in results
+    ]
+
+
+def run_connection_tests(
+    provider_names: list[str],
+    config: dict[str, Any],
+    timeout_seconds: int,
+    max_concurrency: int = 8,
+) -> list[tuple[bool, str]]:
+    """Run `probe_connections` over one shared HTTP client."""
+    from embx.providers.base import shared_http_client
+
+    async def probe_all() -> list[tuple[bool, str]]:
+        async with shared_http_client(timeout_seconds):
+            return await probe_connections(provider_names, config, timeout_seconds, max_concurrency)
+
+    return run_async(probe_all())
+
+
+async def check_ollama_endpoint_async(base_url: str, timeout_seconds: int) -> tuple[str, str]:
+    from embx.providers.base import http_client
+
     try:
-        response = httpx.get(
-            f"{base_url.rstrip('/')}/api/tags",
-            timeout=timeout_seconds,
-        )
+        async with http_client(timeout_seconds) as client:
+            response = await client.get(f"{base_url.rstrip('/')}/api/tags")
         if response.status_code < 400:
             return "ok", f"HTTP {response.status_code}"
         return "error", f"HTTP {response.status_code}"
     except Exception as exc:
         return "error", str(exc)
+
+
+def check_ollama_endpoint(base_url: str, timeout_seconds: int) -> tuple[str, str]:
+    return run_async(check_ollama_endpoint_async(base_url, timeout_seconds))
+
+
+async def check_endpoints(base_urls: list[str], timeout_seconds: int) -> list[tuple[str, str]]:
+    """Probe endpoints concurrently; results follow `base_urls` order."""
+    import asyncio
+
+    return list(
+        await asyncio.gather(
+            *(check_ollama_endpoint_async(base_url, timeout_seconds) for base_url in base_urls)
+        )
+    )
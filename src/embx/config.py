@@ -2,11 +2,18 @@ from __future__ import annotations
 
 import json
 import os
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from embx.exceptions import ConfigurationError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 DEFAULT_CONFIG: dict[str, Any] = {
     "default_provider": "openai",
@@ -15,6 +22,7 @@ DEFAULT_CONFIG: dict[str, Any] = {
     "retry_attempts": 0,
     "retry_backoff_seconds": 0.25,
     "cache_enabled": True,
+    "models_cache_ttl_seconds": 3600,
     "openai_api_key": "",
     "openrouter_api_key": "",
     "openrouter_base_url": "https://openrouter.ai/api/v1",
@@ -24,26 +32,69 @@ DEFAULT_CONFIG: dict[str, Any] = {
     "huggingface_base_url": "https://router.huggingface.co/hf-inference/models",
     "huggingface_cache_dir": "",
     "huggingface_model_source": "remote",
+    "huggingface_concurrency": 4,
     "voyage_api_key": "",
     "ollama_base_url": "http://localhost:11434",
     "ollama_model": "nomic-embed-text",
+    "ollama_concurrency": 8,
 }
 
+CONFIG_KEYS: tuple[str, ...] = tuple(sorted(DEFAULT_CONFIG))
 
-def _config_path() -> Path:
-    override = os.getenv("EMBX_CONFIG_PATH")
+
+@lru_cache(maxsize=8)
+def _config_path_for(override: str | None, home: str | None) -> Path:
+    _ = home  # Part of the cache key only: Path.home() reads $HOME.
     if override:
         return Path(override).expanduser()
     return Path.home() / ".config" / "embx" / "config.json"
 
 
+def _config_path() -> Path:
+    environ = os.environ
+    return _config_path_for(environ.get("EMBX_CONFIG_PATH"), environ.get("HOME"))
+
+
+def _loads(raw: str | bytes) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data: dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
+# Parsed config files keyed by path, valid while (mtime_ns, size) still match.
+_file_cache: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+
+
+def _remember_file_config(path: Path, parsed: dict[str, Any]) -> None:
+    try:
+        stat = path.stat()
+    except OSError:
+        _file_cache.pop(path, None)
+        return
+    _file_cache[path] = (stat.st_mtime_ns, stat.st_size, dict(parsed))
+
+
 def load_file_config() -> dict[str, Any]:
     path = _config_path()
-    if not path.exists():
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
         return {}
+    except OSError as exc:
+        raise ConfigurationError(f"Cannot read config file at {path}: {exc}") from exc
+    cached = _file_cache.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return dict(cached[2])
     try:
-        raw = path.read_text(encoding="utf-8")
-        parsed = json.loads(raw)
+        with open(path, "rb") as handle:
+            parsed = _loads(handle.read())
     except OSError as exc:
         raise ConfigurationError(f"Cannot read config file at {path}: {exc}") from exc
     except json.JSONDecodeError as exc:
@@ -51,39 +102,46 @@ def load_file_config() -> dict[str, Any]:
 
     if not isinstance(parsed, dict):
         raise ConfigurationError(f"Config file must be a JSON object: {path}")
+    _file_cache[path] = (stat.st_mtime_ns, stat.st_size, dict(parsed))
     return parsed
 
 
+_BOOL_TRUE = frozenset({"1", "true", "yes", "on"})
+
+_ENV_MAP: dict[str, tuple[str, type]] = {
+    "default_provider": ("EMBX_PROVIDER", str),
+    "default_model": ("EMBX_MODEL", str),
+    "timeout_seconds": ("EMBX_TIMEOUT_SECONDS", int),
+    "retry_attempts": ("EMBX_RETRY_ATTEMPTS", int),
+    "retry_backoff_seconds": ("EMBX_RETRY_BACKOFF_SECONDS", float),
+    "cache_enabled": ("EMBX_CACHE_ENABLED", bool),
+    "models_cache_ttl_seconds": ("EMBX_MODELS_CACHE_TTL_SECONDS", int),
+    "openai_api_key": ("EMBX_OPENAI_API_KEY", str),
+    "openrouter_api_key": ("EMBX_OPENROUTER_API_KEY", str),
+    "openrouter_base_url": ("EMBX_OPENROUTER_BASE_URL", str),
+    "openrouter_referer": ("EMBX_OPENROUTER_REFERER", str),
+    "openrouter_title": ("EMBX_OPENROUTER_TITLE", str),
+    "huggingface_api_key": ("EMBX_HUGGINGFACE_API_KEY", str),
+    "huggingface_base_url": ("EMBX_HUGGINGFACE_BASE_URL", str),
+    "huggingface_cache_dir": ("EMBX_HUGGINGFACE_CACHE_DIR", str),
+    "huggingface_model_source": ("EMBX_HUGGINGFACE_MODEL_SOURCE", str),
+    "huggingface_concurrency": ("EMBX_HUGGINGFACE_CONCURRENCY", int),
+    "voyage_api_key": ("EMBX_VOYAGE_API_KEY", str),
+    "ollama_base_url": ("EMBX_OLLAMA_BASE_URL", str),
+    "ollama_model": ("EMBX_OLLAMA_MODEL", str),
+    "ollama_concurrency": ("EMBX_OLLAMA_CONCURRENCY", int),
+}
+
+
 def _parse_bool(value: str) -> bool:
-    normalized = value.strip().lower()
-    return normalized in {"1", "true", "yes", "on"}
+    return value.strip().lower() in _BOOL_TRUE
 
 
 def load_env_config() -> dict[str, Any]:
-    env_map: dict[str, tuple[str, type]] = {
-        "default_provider": ("EMBX_PROVIDER", str),
-        "default_model": ("EMBX_MODEL", str),
-        "timeout_seconds": ("EMBX_TIMEOUT_SECONDS", int),
-        "retry_attempts": ("EMBX_RETRY_ATTEMPTS", int),
-        "retry_backoff_seconds": ("EMBX_RETRY_BACKOFF_SECONDS", float),
-        "cache_enabled": ("EMBX_CACHE_ENABLED", bool),
-        "openai_api_key": ("EMBX_OPENAI_API_KEY", str),
-        "openrouter_api_key": ("EMBX_OPENROUTER_API_KEY", str),
-        "openrouter_base_url": ("EMBX_OPENROUTER_BASE_URL", str),
-        "openrouter_referer": ("EMBX_OPENROUTER_REFERER", str),
-        "openrouter_title": ("EMBX_OPENROUTER_TITLE", str),
-        "huggingface_api_key": ("EMBX_HUGGINGFACE_API_KEY", str),
-        "huggingface_base_url": ("EMBX_HUGGINGFACE_BASE_URL", str),
-        "huggingface_cache_dir": ("EMBX_HUGGINGFACE_CACHE_DIR", str),
-        "huggingface_model_source": ("EMBX_HUGGINGFACE_MODEL_SOURCE", str),
-        "voyage_api_key": ("EMBX_VOYAGE_API_KEY", str),
-        "ollama_base_url": ("EMBX_OLLAMA_BASE_URL", str),
-        "ollama_model": ("EMBX_OLLAMA_MODEL", str),
-    }
-
     out: dict[str, Any] = {}
-    for key, (env_var, expected_type) in env_map.items():
-        value = os.getenv(env_var)
+    environ = os.environ
+    for key, (env_var, expected_type) in _ENV_MAP.items():
+        value = environ.get(env_var)
         if value is None:
             continue
         if expected_type is bool:
@@ -103,7 +161,40 @@ def load_env_config() -> dict[str, Any]:
     return out
 
 
+_RESOLVED_CACHE_SIZE = 8
+_resolved_cache: dict[tuple[Any, ...], dict[str, Any]] = {}
+
+
+def _resolve_cache_key(cli_overrides: dict[str, Any] | None) -> tuple[Any, ...] | None:
+    path = _config_path()
+    try:
+        stat = path.stat()
+        file_signature: tuple[Any, ...] = (str(path), stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        file_signature = (str(path), None, None)
+    except OSError:
+        return None
+
+    env_signature = tuple(
+        sorted((name, value) for name, value in os.environ.items() if name.startswith("EMBX_"))
+    )
+    overrides = tuple(
+        sorted((key, value) for key, value in (cli_overrides or {}).items() if value is not None)
+    )
+    key = (file_signature, env_signature, overrides)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 def resolve_config(cli_overrides: dict[str, Any] | None = None) -> dict[str, Any]:
+    cache_key = _resolve_cache_key(cli_overrides)
+    cached = _resolved_cache.get(cache_key) if cache_key is not None else None
+    if cached is not None:
+        return dict(cached)
+
     config = DEFAULT_CONFIG.copy()
     config.update(load_file_config())
     config.update(load_env_config())
@@ -111,25 +202,47 @@ def resolve_config(cli_overrides: dict[str, Any] | None = None) -> dict[str, Any
         for key, value in cli_overrides.items():
             if value is not None:
                 config[key] = value
+
+    if cache_key is not None:
+        if len(_resolved_cache) >= _RESOLVED_CACHE_SIZE:
+            _resolved_cache.pop(next(iter(_resolved_cache)))
+        _resolved_cache[cache_key] = dict(config)
     return config
 
 
+def _write_config_file(path: Path, data: dict[str, Any]) -> None:
+    """Write via a temp file and `os.replace`, so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(_dumps(data) + "\n")
+        try:
+            os.chmod(tmp_name, path.stat().st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    _remember_file_config(path, data)
+    _resolved_cache.clear()
+
+
 def init_config(force: bool = False) -> Path:
     path = _config_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
     if path.exists() and not force:
         raise ConfigurationError(f"Config already exists at {path}. Use --force to overwrite.")
-    content = json.dumps(DEFAULT_CONFIG, indent=2) + "\n"
-    path.write_text(content, encoding="utf-8")
+    _write_config_file(path, DEFAULT_CONFIG)
     return path
 
 
-def upsert_config(values: dict[str, Any]) -> Path:
+def upsert_config(values: dict[str, Any], current: dict[str, Any] | None = None) -> Path:
+    """Merge `values` into the config file; pass `current` if the file was just loaded."""
     path = _config_path()
 
-    current: dict[str, Any] = {}
-    if path.exists():
-        current = load_file_config()
+    if current is None:
+        current = load_file_config() if path.exists() else {}
 
     merged = DEFAULT_CONFIG.copy()
     merged.update(current)
@@ -137,15 +250,24 @@ def upsert_config(values: dict[str, Any]) -> Path:
         if value is not None:
             merged[key] = value
 
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(merged, indent=2) + "\n", encoding="utf-8")
+    _write_config_file(path, merged)
     return path
 
 
+def _is_sensitive_key(key: str) -> bool:
+    lowered = key.lower()
+    return "key" in lowered or "token" in lowered
+
+
+_SENSITIVE_KEYS = frozenset(key for key in DEFAULT_CONFIG if _is_sensitive_key(key))
+
+
 def masked_config(config: dict[str, Any]) -> dict[str, Any]:
     out = dict(config)
-    for key in list(out.keys()):
-        if "key" in key.lower() or "token" in key.lower():
-            value = str(out[key])
-            out[key] = "" if not value else f"{value[:4]}..."
+    for key, value in out.items():
+        # Known keys are classified once; unknown keys (e.g. hand-edited) use the same rule.
+        sensitive = key in _SENSITIVE_KEYS if key in DEFAULT_CONFIG else _is_sensitive_key(key)
+        if sensitive:
+            text = str(value)
+            out[key] = "" if not text else f"{text[:4]}..."
     return out
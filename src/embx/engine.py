@@ -1,18 +1,93 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import nullcontext
+from typing import Any, cast
 
-from embx.cache import EmbeddingCache
+import httpx
+
+from embx.cache import EmbeddingCache, default_cache_path
 from embx.exceptions import ConfigurationError, ProviderError
 from embx.models import EmbeddingResult
-from embx.providers.base import EmbeddingProvider
+from embx.providers.base import EmbeddingProvider, bind_http_client, has_shared_http_client
 from embx.providers.registry import get_provider
 
 
+_ENGINE_CACHE_SIZE = 8
+_engines: dict[tuple[Any, ...], EmbeddingEngine] = {}
+
+
+def get_engine(config: dict[str, Any]) -> EmbeddingEngine:
+    """Return a process-wide engine for an equal config, reusing its open cache."""
+    try:
+        key = (str(default_cache_path()), tuple(sorted(config.items())))
+        engine = _engines.get(key)
+    except TypeError:
+        return EmbeddingEngine(config)
+    if engine is None:
+        if len(_engines) >= _ENGINE_CACHE_SIZE:
+            _engines.pop(next(iter(_engines))).release_http_client()
+        engine = _engines[key] = EmbeddingEngine(dict(config))
+    return engine
+
+
+async def close_engines() -> None:
+    """Close the HTTP clients of every cached engine; run on the loop that used them."""
+    for engine in list(_engines.values()):
+        await engine.aclose()
+
+
+async def _own_http_client(client: httpx.AsyncClient) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Yield `client` once, then stay suspended until finalized; finalizing closes it.
+
+    An httpx client can only be closed on the loop that opened it (afterwards `aclose()`
+    fails with "Event loop is closed" and the sockets leak), so the engine never closes
+    it directly from a synchronous path. Instead the engine parks the client here after
+    the first `anext()`, and asyncio finalizes the suspended generator on its own loop:
+
+    - `engine.aclose()` on that loop calls the generator's `aclose()` right away;
+    - once the engine drops it (`release_http_client()` on a loop change or
+      `get_engine` eviction), the loop's async-generator finalizer hook schedules
+      `aclose()` on that loop;
+    - when `asyncio.run()` / `asyncio.Runner.close()` end the loop,
+      `shutdown_asyncgens()` closes any generator still suspended.
+    """
+    try:
+        yield client
+    finally:
+        await client.aclose()
+
+
 class EmbeddingEngine:
     def __init__(self, config: dict) -> None:
         self.config = config
         self.cache = EmbeddingCache(enabled=bool(config.get("cache_enabled", True)))
+        self._http: httpx.AsyncClient | None = None
+        self._http_owner: AsyncGenerator[httpx.AsyncClient, None] | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
+
+    async def _http_client(self) -> httpx.AsyncClient:
+        # Keep-alive connections belong to the loop that opened them; start over on a new loop.
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http_loop is not loop or self._http.is_closed:
+            self.release_http_client()
+            owner = _own_http_client(
+                httpx.AsyncClient(timeout=int(self.config.get("timeout_seconds", 30)))
+            )
+            self._http = await anext(owner)
+            self._http_owner, self._http_loop = owner, loop
+        return self._http
+
+    def release_http_client(self) -> None:
+        """Drop the client; its owning loop closes it (at once if the loop is still alive)."""
+        self._http = self._http_owner = self._http_loop = None
+
+    async def aclose(self) -> None:
+        owner, loop = self._http_owner, self._http_loop
+        self.release_http_client()
+        if owner is not None and loop is asyncio.get_running_loop():
+            await owner.aclose()
 
     async def embed_texts(
         self,
@@ -25,45 +100,54 @@ class EmbeddingEngine:
         provider = get_provider(provider_name)
         resolved_model = model or provider.default_model
 
-        ordered: list[EmbeddingResult | None] = [None for _ in texts]
-        missing_indices: list[int] = []
-        missing_texts: list[str] = []
+        cached_vectors: dict[str, list[float]] = {}
+        if use_cache:
+            cached_vectors = self.cache.get_many(provider_name, resolved_model, dimensions, texts)
 
-        for idx, text in enumerate(texts):
-            if use_cache:
-                cached_vector = self.cache.get(provider_name, resolved_model, dimensions, text)
-                if cached_vector is not None:
-                    ordered[idx] = EmbeddingResult(
-                        text=text,
-                        vector=cached_vector,
-                        provider=provider_name,
-                        model=resolved_model,
-                        cached=True,
-                    )
-                    continue
-
-            missing_indices.append(idx)
-            missing_texts.append(text)
-
-        if missing_texts:
-            fetched = await self._embed_with_retry(
-                provider=provider,
-                texts=missing_texts,
+        ordered: list[EmbeddingResult | None] = [
+            EmbeddingResult(
+                text=text,
+                vector=vector,
+                provider=provider_name,
                 model=resolved_model,
-                dimensions=dimensions,
+                cached=True,
+            )
+            if (vector := cached_vectors.get(text)) is not None
+            else None
+            for text in texts
+        ]
+        # Send misses shortest first so provider-side batches pad to similar lengths.
+        missing_indices = sorted(
+            (idx for idx, item in enumerate(ordered) if item is None),
+            key=lambda idx: len(texts[idx]),
+        )
+
+        if missing_indices:
+            # compare and doctor bind a pooled client already; only open ours otherwise.
+            binding = (
+                nullcontext()
+                if has_shared_http_client()
+                else bind_http_client(await self._http_client())
             )
+            with binding:
+                fetched = await self._embed_with_retry(
+                    provider=provider,
+                    texts=[texts[idx] for idx in missing_indices],
+                    model=resolved_model,
+                    dimensions=dimensions,
+                )
             for idx, item in zip(missing_indices, fetched, strict=True):
                 ordered[idx] = item
-                if use_cache:
-                    self.cache.set(
-                        provider=provider_name,
-                        model=resolved_model,
-                        dimensions=dimensions,
-                        text=item.text,
-                        vector=item.vector,
-                    )
-
-        return [item for item in ordered if item is not None]
+            if use_cache:
+                self.cache.set_many(
+                    provider=provider_name,
+                    model=resolved_model,
+                    dimensions=dimensions,
+                    items=[(item.text, item.vector) for item in fetched],
+                )
+
+        # Every slot is filled: cache hits above, misses by the strict zip.
+        return cast("list[EmbeddingResult]", ordered)
 
     async def _embed_with_retry(
         self,
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 
 
 @dataclass(slots=True)
@@ -12,4 +12,8 @@ class EmbeddingResult:
     cached: bool = False
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Shallow on purpose: asdict() would deep-copy every vector.
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
+
+
+_FIELD_NAMES = tuple(field.name for field in fields(EmbeddingResult))
@@ -1,3 +1,13 @@
-from embx.providers.registry import available_provider_metadata, get_provider
+from embx.providers.registry import (
+    available_provider_metadata,
+    available_provider_names,
+    clear_provider_cache,
+    get_provider,
+)
 
-__all__ = ["available_provider_metadata", "get_provider"]
+__all__ = [
+    "available_provider_metadata",
+    "available_provider_names",
+    "clear_provider_cache",
+    "get_provider",
+]
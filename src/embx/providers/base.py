@@ -1,11 +1,75 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import AsyncIterator, Awaitable, Iterable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+import httpx
 
 from embx.models import EmbeddingResult
 
 
+T = TypeVar("T")
+
+_shared_client: ContextVar[httpx.AsyncClient | None] = ContextVar(
+    "embx_shared_http_client", default=None
+)
+
+
+@asynccontextmanager
+async def shared_http_client(timeout_seconds: float) -> AsyncIterator[httpx.AsyncClient]:
+    """Share one connection pool across every provider call made inside the block."""
+    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+        token = _shared_client.set(client)
+        try:
+            yield client
+        finally:
+            _shared_client.reset(token)
+
+
+def has_shared_http_client() -> bool:
+    return _shared_client.get() is not None
+
+
+@contextmanager
+def bind_http_client(client: httpx.AsyncClient) -> Iterator[None]:
+    """Route provider calls in the block through `client`, unless one is already shared."""
+    if _shared_client.get() is not None:
+        yield
+        return
+    token = _shared_client.set(client)
+    try:
+        yield
+    finally:
+        _shared_client.reset(token)
+
+
+@asynccontextmanager
+async def http_client(timeout_seconds: float) -> AsyncIterator[httpx.AsyncClient]:
+    shared = _shared_client.get()
+    if shared is not None:
+        yield shared
+        return
+    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+        yield client
+
+
+async def gather_in_order(aws: Iterable[Awaitable[T]]) -> list[T]:
+    """Await concurrently, in input order; on the first failure cancel and drain the rest."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        # Drain the rest so their errors are not reported as never retrieved.
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 class EmbeddingProvider(ABC):
     name: str
     default_model: str
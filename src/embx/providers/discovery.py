@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import tempfile
+import time
 from pathlib import Path
 from typing import Any
 
 import httpx
 
 from embx.exceptions import ConfigurationError, ProviderError, ValidationError
+from embx.providers.base import http_client
 
 
 def _openai_key(config: dict[str, Any]) -> str:
@@ -92,12 +97,17 @@ def _latest_snapshot_path(model_dir: Path) -> Path | None:
     return snapshots[0]
 
 
+_HF_REMOTE_LIMIT = 200
+
+
 async def list_embedding_models(
     provider_name: str,
     config: dict[str, Any],
     timeout_seconds: int,
     source: str = "remote",
+    max_rows: int | None = None,
 ) -> list[dict[str, Any]]:
+    """List models; `max_rows` lets APIs with a server-side limit send fewer rows."""
     if provider_name == "openrouter":
         if source != "remote":
             raise ValidationError("openrouter model discovery supports source=remote only")
@@ -117,12 +127,18 @@ async def list_embedding_models(
         raise ValidationError("Model discovery for voyage is not available yet.")
 
     if provider_name == "huggingface":
+        remote_options: dict[str, int] = {}
+        if max_rows is not None:
+            remote_options["limit"] = min(max_rows, _HF_REMOTE_LIMIT)
         if source == "remote":
-            return await _list_huggingface_remote_models(config, timeout_seconds)
+            return await _list_huggingface_remote_models(config, timeout_seconds, **remote_options)
         if source == "local":
             return _list_huggingface_local_models(config)
         if source == "all":
-            remote = await _list_huggingface_remote_models(config, timeout_seconds)
+            # Local rows come first, so the first `max_rows` remote rows still cover the pick.
+            remote = await _list_huggingface_remote_models(
+                config, timeout_seconds, **remote_options
+            )
             local = _list_huggingface_local_models(config)
             seen: set[str] = set()
             out: list[dict[str, Any]] = []
@@ -138,6 +154,103 @@ async def list_embedding_models(
     raise ValidationError(f"Unknown provider '{provider_name}'")
 
 
+def model_discovery_disabled() -> bool:
+    return os.getenv("EMBX_DISABLE_MODEL_DISCOVERY", "").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+
+
+def models_cache_dir() -> Path:
+    override = os.getenv("EMBX_MODELS_PATH")
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".cache" / "embx" / "models"
+
+
+def _models_cache_file(provider_name: str, source: str, config: dict[str, Any]) -> Path:
+    # Listings differ per endpoint (e.g. two Ollama hosts), so the base URL is part of the key.
+    base_url = str(config.get(f"{provider_name}_base_url", ""))
+    digest = hashlib.sha1(f"{provider_name}\0{source}\0{base_url}".encode()).hexdigest()[:16]
+    return models_cache_dir() / f"{provider_name}-{source}-{digest}.json"
+
+
+def _read_models_cache(path: Path) -> tuple[list[dict[str, Any]], float] | None:
+    try:
+        modified = path.stat().st_mtime
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, list):
+        return None
+    return data, modified
+
+
+def _write_models_cache(path: Path, models: list[dict[str, Any]]) -> None:
+    # The cache is an optimization; an unwritable directory must not fail discovery.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(models, handle)
+        os.replace(tmp_name, path)
+    except (OSError, TypeError, ValueError):
+        Path(tmp_name).unlink(missing_ok=True)
+
+
+async def list_embedding_models_cached(
+    provider_name: str,
+    config: dict[str, Any],
+    timeout_seconds: int,
+    source: str = "remote",
+    ttl_seconds: float = 3600,
+    use_cache: bool = True,
+    max_rows: int | None = None,
+) -> list[dict[str, Any]]:
+    """Serve remote listings from disk within `ttl_seconds`; fall back to stale data offline.
+
+    With `max_rows`, a cache miss fetches a possibly truncated listing that is not stored.
+    """
+    options: dict[str, Any] = {}
+    if max_rows is not None:
+        options["max_rows"] = max_rows
+
+    if source != "remote":
+        return await list_embedding_models(
+            provider_name=provider_name,
+            config=config,
+            timeout_seconds=timeout_seconds,
+            source=source,
+            **options,
+        )
+
+    path = _models_cache_file(provider_name, source, config)
+    cached = _read_models_cache(path) if use_cache else None
+    if cached is not None and time.time() - cached[1] < ttl_seconds:
+        return cached[0]
+
+    try:
+        models = await list_embedding_models(
+            provider_name=provider_name,
+            config=config,
+            timeout_seconds=timeout_seconds,
+            source=source,
+            **options,
+        )
+    except ProviderError:
+        if cached is None:
+            raise
+        return cached[0]
+    if max_rows is None:
+        _write_models_cache(path, models)
+    return models
+
+
 async def test_provider_connection(
     provider_name: str,
     config: dict[str, Any],
@@ -175,7 +288,7 @@ async def _list_openrouter_models(
     if title:
         headers["X-Title"] = title
 
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+    async with http_client(timeout_seconds) as client:
         try:
             response = await client.get(f"{base_url}/embeddings/models", headers=headers)
         except httpx.HTTPError as exc:
@@ -196,7 +309,7 @@ async def _list_openai_models(config: dict[str, Any], timeout_seconds: int) -> l
 
     headers = {"Authorization": f"Bearer {api_key}"}
 
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+    async with http_client(timeout_seconds) as client:
         try:
             response = await client.get("https://api.openai.com/v1/models", headers=headers)
         except httpx.HTTPError as exc:
@@ -218,7 +331,7 @@ async def _list_ollama_models(config: dict[str, Any], timeout_seconds: int) -> l
         or "http://localhost:11434"
     ).rstrip("/")
 
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+    async with http_client(timeout_seconds) as client:
         try:
             response = await client.get(f"{base_url}/api/tags")
         except httpx.HTTPError as exc:
@@ -233,7 +346,7 @@ async def _list_ollama_models(config: dict[str, Any], timeout_seconds: int) -> l
 
 
 async def _list_huggingface_remote_models(
-    config: dict[str, Any], timeout_seconds: int
+    config: dict[str, Any], timeout_seconds: int, limit: int = _HF_REMOTE_LIMIT
 ) -> list[dict[str, Any]]:
     token = _huggingface_key(config)
     headers: dict[str, str] = {}
@@ -244,10 +357,10 @@ async def _list_huggingface_remote_models(
         "pipeline_tag": "feature-extraction",
         "sort": "downloads",
         "direction": "-1",
-        "limit": "200",
+        "limit": str(limit),
     }
 
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+    async with http_client(timeout_seconds) as client:
         try:
             response = await client.get(
                 "https://huggingface.co/api/models", params=params, headers=headers
@@ -303,7 +416,7 @@ async def _test_voyage_embeddings(config: dict[str, Any], timeout_seconds: int)
     }
     payload = {"model": "voyage-3-lite", "input": ["ping"]}
 
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+    async with http_client(timeout_seconds) as client:
         try:
             response = await client.post(
                 "https://api.voyageai.com/v1/embeddings", json=payload, headers=headers
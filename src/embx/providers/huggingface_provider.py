@@ -1,43 +1,45 @@
 from __future__ import annotations
 
+import asyncio
 import os
+from array import array
+from itertools import chain
 from typing import Any
 
 import httpx
 
 from embx.exceptions import ConfigurationError, ProviderError
 from embx.models import EmbeddingResult
-from embx.providers.base import EmbeddingProvider
+from embx.providers.base import EmbeddingProvider, gather_in_order, http_client
 
 
-def _is_number(value: Any) -> bool:
-    return isinstance(value, (int, float))
-
-
-def _is_vector(value: Any) -> bool:
-    return isinstance(value, list) and all(_is_number(item) for item in value)
+def _as_vector(value: Any) -> list[float] | None:
+    # array("d") validates and converts to float in one C-level pass; it rejects nested lists.
+    if not isinstance(value, list):
+        return None
+    try:
+        return array("d", value).tolist()
+    except TypeError:
+        return None
 
 
 def _normalize_response(data: Any, expected_count: int) -> list[list[float]]:
-    if expected_count == 1 and _is_vector(data):
-        return [[float(item) for item in data]]
+    if expected_count == 1 and (vector := _as_vector(data)) is not None:
+        return [vector]
 
-    if (
-        isinstance(data, list)
-        and len(data) == expected_count
-        and all(_is_vector(item) for item in data)
-    ):
-        return [[float(v) for v in item] for item in data]
+    if isinstance(data, list) and len(data) == expected_count:
+        vectors = [_as_vector(item) for item in data]
+        if None not in vectors:
+            return vectors
 
     if isinstance(data, dict):
         embeddings = data.get("embeddings") or data.get("data")
         if isinstance(embeddings, list):
-            vectors: list[list[float]] = []
-            for item in embeddings:
-                if isinstance(item, dict) and _is_vector(item.get("embedding")):
-                    vectors.append([float(v) for v in item["embedding"]])
-                elif _is_vector(item):
-                    vectors.append([float(v) for v in item])
+            vectors = [
+                _as_vector(item.get("embedding") if isinstance(item, dict) else item)
+                for item in embeddings
+            ]
+            vectors = [vector for vector in vectors if vector is not None]
             if len(vectors) == expected_count:
                 return vectors
 
@@ -51,6 +53,8 @@ class HuggingFaceProvider(EmbeddingProvider):
     name = "huggingface"
     default_model = "sentence-transformers/all-MiniLM-L6-v2"
     required_config_keys = ("huggingface_api_key",)
+    # Inputs per feature-extraction request; larger lists are split and sent concurrently.
+    max_batch_size = 64
 
     async def embed(
         self,
@@ -83,31 +87,36 @@ class HuggingFaceProvider(EmbeddingProvider):
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         }
-        payload = {
-            "inputs": texts,
-        }
-
-        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-            try:
-                response = await client.post(url, json=payload, headers=headers)
-            except httpx.HTTPError as exc:
-                raise ProviderError(f"HuggingFace request failed: {exc}") from exc
-
-        if response.status_code >= 400:
-            raise ProviderError(
-                f"HuggingFace embeddings request failed ({response.status_code}): {response.text}"
+        batch_size = self.max_batch_size
+        semaphore = asyncio.Semaphore(max(1, int(config.get("huggingface_concurrency", 4))))
+
+        async with http_client(timeout_seconds) as client:
+
+            async def embed_batch(batch: list[str]) -> list[list[float]]:
+                async with semaphore:
+                    try:
+                        response = await client.post(url, json={"inputs": batch}, headers=headers)
+                    except httpx.HTTPError as exc:
+                        raise ProviderError(f"HuggingFace request failed: {exc}") from exc
+                if response.status_code >= 400:
+                    raise ProviderError(
+                        f"HuggingFace embeddings request failed ({response.status_code}): {response.text}"
+                    )
+                return _normalize_response(response.json(), expected_count=len(batch))
+
+            batches = await gather_in_order(
+                embed_batch(texts[start : start + batch_size])
+                for start in range(0, len(texts), batch_size)
             )
 
-        vectors = _normalize_response(response.json(), expected_count=len(texts))
-        out: list[EmbeddingResult] = []
-        for text, vector in zip(texts, vectors, strict=True):
-            out.append(
-                EmbeddingResult(
-                    text=text,
-                    vector=vector,
-                    provider=self.name,
-                    model=model,
-                    cached=False,
-                )
+        vectors = chain.from_iterable(batches)
+        return [
+            EmbeddingResult(
+                text=text,
+                vector=vector,
+                provider=self.name,
+                model=model,
+                cached=False,
             )
-        return out
+            for text, vector in zip(texts, vectors, strict=True)
+        ]
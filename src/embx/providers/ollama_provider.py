@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import Any
 
@@ -7,7 +8,7 @@ import httpx
 
 from embx.exceptions import ProviderError
 from embx.models import EmbeddingResult
-from embx.providers.base import EmbeddingProvider
+from embx.providers.base import EmbeddingProvider, gather_in_order, http_client
 
 
 class OllamaProvider(EmbeddingProvider):
@@ -29,31 +30,33 @@ class OllamaProvider(EmbeddingProvider):
             or "http://localhost:11434"
         ).rstrip("/")
 
-        out: list[EmbeddingResult] = []
-        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-            for text in texts:
-                try:
-                    response = await client.post(
-                        f"{base_url}/api/embeddings",
-                        json={"model": model, "prompt": text},
-                    )
-                except httpx.HTTPError as exc:
-                    raise ProviderError(f"Ollama request failed: {exc}") from exc
+        endpoint = f"{base_url}/api/embeddings"
+        # /api/embeddings takes one prompt per request; cap how many are in flight at once.
+        semaphore = asyncio.Semaphore(max(1, int(config.get("ollama_concurrency", 8))))
+
+        async with http_client(timeout_seconds) as client:
+
+            async def embed_one(text: str) -> EmbeddingResult:
+                async with semaphore:
+                    try:
+                        response = await client.post(
+                            endpoint, json={"model": model, "prompt": text}
+                        )
+                    except httpx.HTTPError as exc:
+                        raise ProviderError(f"Ollama request failed: {exc}") from exc
                 if response.status_code >= 400:
                     raise ProviderError(
                         f"Ollama embeddings request failed ({response.status_code}): {response.text}"
                     )
-                body = response.json()
-                vector = body.get("embedding")
+                vector = response.json().get("embedding")
                 if not isinstance(vector, list):
                     raise ProviderError("Ollama response missing embedding vector")
-                out.append(
-                    EmbeddingResult(
-                        text=text,
-                        vector=vector,
-                        provider=self.name,
-                        model=model,
-                        cached=False,
-                    )
+                return EmbeddingResult(
+                    text=text,
+                    vector=vector,
+                    provider=self.name,
+                    model=model,
+                    cached=False,
                 )
-        return out
+
+            return await gather_in_order(embed_one(text) for text in texts)
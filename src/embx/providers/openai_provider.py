@@ -7,7 +7,7 @@ import httpx
 
 from embx.exceptions import ConfigurationError, ProviderError
 from embx.models import EmbeddingResult
-from embx.providers.base import EmbeddingProvider
+from embx.providers.base import EmbeddingProvider, http_client
 
 
 _PRICE_PER_1M_TOKENS = {
@@ -52,7 +52,7 @@ class OpenAIProvider(EmbeddingProvider):
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+        async with http_client(timeout_seconds) as client:
             try:
                 response = await client.post(
                     "https://api.openai.com/v1/embeddings",
@@ -7,7 +7,7 @@ import httpx
 
 from embx.exceptions import ConfigurationError, ProviderError
 from embx.models import EmbeddingResult
-from embx.providers.base import EmbeddingProvider
+from embx.providers.base import EmbeddingProvider, http_client
 
 
 class OpenRouterProvider(EmbeddingProvider):
@@ -57,7 +57,7 @@ class OpenRouterProvider(EmbeddingProvider):
         if title:
             headers["X-Title"] = title
 
-        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+        async with http_client(timeout_seconds) as client:
             try:
                 response = await client.post(
                     f"{base_url}/embeddings",
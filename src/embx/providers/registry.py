@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from embx.exceptions import ValidationError
 from embx.providers.base import EmbeddingProvider
 from embx.providers.huggingface_provider import HuggingFaceProvider
@@ -18,15 +20,28 @@ _PROVIDER_TYPES: dict[str, type[EmbeddingProvider]] = {
 }
 
 
+# Providers are stateless (config is passed per call), so one instance per name is shared.
+_provider_instances: dict[str, EmbeddingProvider] = {}
+
+
 def get_provider(name: str) -> EmbeddingProvider:
+    provider = _provider_instances.get(name)
+    if provider is not None:
+        return provider
     provider_type = _PROVIDER_TYPES.get(name)
     if provider_type is None:
         available = ", ".join(sorted(_PROVIDER_TYPES))
         raise ValidationError(f"Unknown provider '{name}'. Available providers: {available}")
-    return provider_type()
+    provider = _provider_instances[name] = provider_type()
+    return provider
 
 
-def available_provider_metadata() -> list[dict[str, str]]:
+def clear_provider_cache() -> None:
+    _provider_instances.clear()
+
+
+@lru_cache(maxsize=1)
+def _provider_metadata_rows() -> tuple[dict[str, str], ...]:
     rows: list[dict[str, str]] = []
     for name, provider_type in sorted(_PROVIDER_TYPES.items()):
         required = getattr(provider_type, "required_config_keys", ())
@@ -37,4 +52,13 @@ def available_provider_metadata() -> list[dict[str, str]]:
                 "requires": ", ".join(required) if required else "none",
             }
         )
-    return rows
+    return tuple(rows)
+
+
+def available_provider_metadata() -> list[dict[str, str]]:
+    return [dict(row) for row in _provider_metadata_rows()]
+
+
+@lru_cache(maxsize=1)
+def available_provider_names() -> frozenset[str]:
+    return frozenset(_PROVIDER_TYPES)
@@ -7,7 +7,7 @@ import httpx
 
 from embx.exceptions import ConfigurationError, ProviderError
 from embx.models import EmbeddingResult
-from embx.providers.base import EmbeddingProvider
+from embx.providers.base import EmbeddingProvider, http_client
 
 
 class VoyageProvider(EmbeddingProvider):
@@ -45,7 +45,7 @@ class VoyageProvider(EmbeddingProvider):
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+        async with http_client(timeout_seconds) as client:
             try:
                 response = await client.post(
                     "https://api.voyageai.com/v1/embeddings",
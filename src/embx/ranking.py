@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import heapq
+import inspect
 from dataclasses import dataclass
 from typing import Any, Callable
 
@@ -10,11 +12,22 @@ RankRow = dict[str, Any]
 RankingFn = Callable[[list[RankRow]], list[RankRow]]
 
 RANKING_FACTORY: dict[str, RankingFn] = {}
+# Strategies that accept an optional keyword-only `top` and select the best rows themselves.
+_TOP_AWARE_RANKINGS: set[str] = set()
+
+
+def _accepts_top(func: RankingFn) -> bool:
+    parameter = inspect.signature(func).parameters.get("top")
+    return parameter is not None and parameter.kind is inspect.Parameter.KEYWORD_ONLY
 
 
 def register_ranking(name: str) -> Callable[[RankingFn], RankingFn]:
     def decorator(func: RankingFn) -> RankingFn:
         RANKING_FACTORY[name] = func
+        if _accepts_top(func):
+            _TOP_AWARE_RANKINGS.add(name)
+        else:
+            _TOP_AWARE_RANKINGS.discard(name)
         return func
 
     return decorator
@@ -77,27 +90,42 @@ def _assign_quality_scores(rows: list[RankRow]) -> None:
         row["quality_score"] = 0.0 if not scores else sum(scores) / len(scores)
 
 
+def _select(
+    rows: list[RankRow],
+    key: Callable[[RankRow], float],
+    top: int | None,
+    reverse: bool = False,
+) -> list[RankRow]:
+    # nsmallest/nlargest match sorted(...)[:top], ties included, in O(n log top).
+    if top is None:
+        return sorted(rows, key=key, reverse=reverse)
+    if reverse:
+        return heapq.nlargest(top, rows, key=key)
+    return heapq.nsmallest(top, rows, key=key)
+
+
 @register_ranking("none")
 def _rank_none(rows: list[RankRow]) -> list[RankRow]:
     return list(rows)
 
 
 @register_ranking("latency")
-def _rank_latency(rows: list[RankRow]) -> list[RankRow]:
-    return sorted(rows, key=lambda row: float(row["latency_ms"]))
+def _rank_latency(rows: list[RankRow], *, top: int | None = None) -> list[RankRow]:
+    return _select(rows, lambda row: float(row["latency_ms"]), top)
 
 
 @register_ranking("cost")
-def _rank_cost(rows: list[RankRow]) -> list[RankRow]:
-    return sorted(
+def _rank_cost(rows: list[RankRow], *, top: int | None = None) -> list[RankRow]:
+    return _select(
         rows,
-        key=lambda row: float(row["cost_usd"]) if row["cost_usd"] is not None else float("inf"),
+        lambda row: float(row["cost_usd"]) if row["cost_usd"] is not None else float("inf"),
+        top,
     )
 
 
 @register_ranking("quality")
-def _rank_quality(rows: list[RankRow]) -> list[RankRow]:
-    return sorted(rows, key=lambda row: float(row["quality_score"]), reverse=True)
+def _rank_quality(rows: list[RankRow], *, top: int | None = None) -> list[RankRow]:
+    return _select(rows, lambda row: float(row["quality_score"]), top, reverse=True)
 
 
 @dataclass(slots=True)
@@ -107,28 +135,35 @@ class RankingResult:
     error_rows: list[RankRow]
 
 
-def apply_ranking(rows: list[RankRow], rank_by: str) -> RankingResult:
-    successful_rows = [row for row in rows if row.get("status") == "ok"]
-    error_rows = [row for row in rows if row.get("status") != "ok"]
+def apply_ranking(rows: list[RankRow], rank_by: str, top: int | None = None) -> RankingResult:
+    successful_rows: list[RankRow] = []
+    error_rows: list[RankRow] = []
+    for row in rows:
+        row["rank"] = None
+        if row.get("status") == "ok":
+            successful_rows.append(row)
+        else:
+            error_rows.append(row)
 
+    # Quality scores are part of the output even when nothing is ranked.
     _assign_quality_scores(successful_rows)
 
     if rank_by == "none":
-        ranked_rows = list(rows)
-        for row in ranked_rows:
-            row["rank"] = None
         return RankingResult(
-            ranked_rows=ranked_rows,
+            ranked_rows=rows,
             successful_rows=successful_rows,
             error_rows=error_rows,
         )
 
     ranking_fn = ranking_factory(rank_by)
-    ranked_successful_rows = ranking_fn(successful_rows)
+    if top is None:
+        ranked_successful_rows = ranking_fn(successful_rows)
+    elif rank_by in _TOP_AWARE_RANKINGS:
+        ranked_successful_rows = ranking_fn(successful_rows, top=top)
+    else:
+        ranked_successful_rows = ranking_fn(successful_rows)[:top]
     for index, row in enumerate(ranked_successful_rows, start=1):
         row["rank"] = index
-    for row in error_rows:
-        row["rank"] = None
 
     return RankingResult(
         ranked_rows=ranked_successful_rows + error_rows,
@@ -0,0 +1,6 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolate_models_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("EMBX_MODELS_PATH", str(tmp_path / "models"))
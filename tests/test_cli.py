@@ -34,6 +34,36 @@ def test_embed_without_input_fails() -> None:
     assert "No input found" in result.output
 
 
+def test_embed_reads_utf8_stdin(monkeypatch) -> None:
+    async def fake_embed_texts(
+        self,
+        texts,
+        provider_name,
+        model=None,
+        dimensions=None,
+        use_cache=True,
+    ):
+        _ = (self, provider_name, dimensions, use_cache)
+        assert texts == ["héllo wörld"]
+        return [
+            EmbeddingResult(
+                text=texts[0],
+                vector=[0.1, 0.2],
+                provider="mock",
+                model=model or "mock-model",
+                cached=False,
+            )
+        ]
+
+    monkeypatch.setattr("embx.engine.EmbeddingEngine.embed_texts", fake_embed_texts)
+
+    result = runner.invoke(
+        app, ["embed", "--format", "json"], input="  héllo wörld\n".encode("utf-8")
+    )
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["text"] == "héllo wörld"
+
+
 def test_config_init_and_show() -> None:
     with runner.isolated_filesystem():
         config_path = Path("embx.test.config.json")
@@ -98,6 +128,23 @@ def test_connect_openrouter_flags() -> None:
         assert data["default_provider"] == "openrouter"
 
 
+def test_connect_skips_write_when_nothing_changed() -> None:
+    with runner.isolated_filesystem():
+        config_path = Path("embx.connect.config.json")
+        env = {"EMBX_CONFIG_PATH": str(config_path)}
+        args = ["connect", "--provider", "voyage", "--api-key", "sk-voyage", "--non-interactive"]
+
+        first = runner.invoke(app, args, env=env)
+        saved_mtime = config_path.stat().st_mtime_ns
+        second = runner.invoke(app, args, env=env)
+
+        assert first.exit_code == 0
+        assert "Saved configuration" in first.stdout
+        assert second.exit_code == 0
+        assert "No changes" in second.stdout
+        assert config_path.stat().st_mtime_ns == saved_mtime
+
+
 def test_connect_huggingface_model_source_local_non_interactive() -> None:
     with runner.isolated_filesystem():
         config_path = Path("embx.connect.hf.config.json")
@@ -164,8 +211,8 @@ def test_connect_all_wizard_multiple_providers() -> None:
 
 def test_connect_test_flag_success(monkeypatch) -> None:
     monkeypatch.setattr(
-        "embx.commands.connect._run_connect_test",
-        lambda provider_name, cfg, timeout_seconds: (True, "ok"),
+        "embx.commands.connect._run_connect_tests",
+        lambda provider_names, cfg, timeout_seconds: [(True, "ok") for _ in provider_names],
     )
 
     with runner.isolated_filesystem():
@@ -190,8 +237,8 @@ def test_connect_test_flag_success(monkeypatch) -> None:
 
 def test_connect_test_flag_failure(monkeypatch) -> None:
     monkeypatch.setattr(
-        "embx.commands.connect._run_connect_test",
-        lambda provider_name, cfg, timeout_seconds: (False, "bad key"),
+        "embx.commands.connect._run_connect_tests",
+        lambda provider_names, cfg, timeout_seconds: [(False, "bad key") for _ in provider_names],
     )
 
     with runner.isolated_filesystem():
@@ -481,6 +528,46 @@ def test_quickstart_discovery_failure_falls_back_to_default_model(monkeypatch) -
     assert "Using provider default model: text-embedding-3-small" in result.output
 
 
+def test_quickstart_skips_discovery_when_disabled(monkeypatch) -> None:
+    async def fail_list_embedding_models(*args, **kwargs):
+        raise AssertionError("model discovery should be skipped")
+
+    async def fake_embed_texts(
+        self,
+        texts,
+        provider_name,
+        model=None,
+        dimensions=None,
+        use_cache=True,
+    ):
+        _ = (self, dimensions, use_cache)
+        return [
+            EmbeddingResult(
+                text=texts[0],
+                vector=[0.9, 0.8],
+                provider=provider_name,
+                model=model or "text-embedding-3-small",
+                cached=False,
+            )
+        ]
+
+    monkeypatch.setattr(
+        "embx.providers.discovery.list_embedding_models", fail_list_embedding_models
+    )
+    monkeypatch.setattr("embx.engine.EmbeddingEngine.embed_texts", fake_embed_texts)
+
+    result = runner.invoke(
+        app,
+        ["quickstart", "hello", "--provider", "openai"],
+        input="n\n",
+        env={"EMBX_OPENAI_API_KEY": "sk-openai", "EMBX_DISABLE_MODEL_DISCOVERY": "1"},
+    )
+
+    assert result.exit_code == 0
+    assert "Model discovery warning" not in result.output
+    assert "Using provider default model: text-embedding-3-small" in result.output
+
+
 def test_quickstart_csv_output(monkeypatch) -> None:
     async def fake_list_embedding_models(
         provider_name: str,
@@ -611,8 +698,10 @@ def test_models_pick_outputs_id(monkeypatch) -> None:
         config: dict,
         timeout_seconds: int,
         source: str = "remote",
+        max_rows: int | None = None,
     ):
         _ = (provider_name, config, timeout_seconds, source)
+        assert max_rows == 2
         return [
             {"id": "model/a", "name": "A"},
             {"id": "model/b", "name": "B"},
@@ -664,8 +753,10 @@ def test_models_pick_save_default_updates_config(monkeypatch) -> None:
         config: dict,
         timeout_seconds: int,
         source: str = "remote",
+        max_rows: int | None = None,
     ):
         _ = (provider_name, config, timeout_seconds, source)
+        assert max_rows == 2
         return [
             {"id": "model/a", "name": "A"},
             {"id": "model/b", "name": "B"},
@@ -866,6 +957,57 @@ def test_compare_continue_on_error_keeps_success(monkeypatch) -> None:
     assert statuses["voyage"] == "ok"
 
 
+def test_compare_max_concurrency_limits_in_flight_providers(monkeypatch) -> None:
+    import asyncio
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_embed_texts(
+        self,
+        texts,
+        provider_name,
+        model=None,
+        dimensions=None,
+        use_cache=True,
+    ):
+        nonlocal in_flight, peak
+        _ = (texts, model, dimensions, use_cache)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [
+            EmbeddingResult(
+                text="x",
+                vector=[0.0, 1.0],
+                provider=provider_name,
+                model="mock",
+                cached=False,
+            )
+        ]
+
+    monkeypatch.setattr("embx.engine.EmbeddingEngine.embed_texts", fake_embed_texts)
+
+    result = runner.invoke(
+        app,
+        [
+            "compare",
+            "hello",
+            "--providers",
+            "openai,voyage,ollama",
+            "--max-concurrency",
+            "2",
+            "--format",
+            "json",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert len(json.loads(result.stdout)) == 3
+    assert peak == 2
+
+
 def test_compare_fail_fast_stops_on_error(monkeypatch) -> None:
     async def fake_embed_texts(
         self,
@@ -1015,6 +1157,121 @@ def test_batch_csv_output(monkeypatch) -> None:
     assert "second" in result.stdout
 
 
+def test_batch_jsonl_skips_blank_lines(monkeypatch) -> None:
+    seen: list[list[str]] = []
+
+    async def fake_embed_texts(
+        self,
+        texts,
+        provider_name,
+        model=None,
+        dimensions=None,
+        use_cache=True,
+    ):
+        _ = (provider_name, model, dimensions, use_cache)
+        seen.append(list(texts))
+        return [
+            EmbeddingResult(
+                text=value,
+                vector=[0.1, 0.2],
+                provider="mock",
+                model="mock-model",
+                cached=False,
+            )
+            for value in texts
+        ]
+
+    monkeypatch.setattr("embx.engine.EmbeddingEngine.embed_texts", fake_embed_texts)
+
+    with runner.isolated_filesystem():
+        input_path = Path("inputs.txt")
+        input_path.write_bytes("  first \r\n\n   \nsécond\n".encode("utf-8"))
+        result = runner.invoke(app, ["batch", str(input_path)])
+
+    assert result.exit_code == 0
+    assert seen == [["first", "sécond"]]
+    rows = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [row["text"] for row in rows] == ["first", "sécond"]
+
+
+def test_batch_splits_on_every_splitlines_boundary(monkeypatch) -> None:
+    seen: list[list[str]] = []
+
+    async def fake_embed_texts(
+        self,
+        texts,
+        provider_name,
+        model=None,
+        dimensions=None,
+        use_cache=True,
+    ):
+        _ = (provider_name, model, dimensions, use_cache)
+        seen.append(list(texts))
+        return [
+            EmbeddingResult(
+                text=value,
+                vector=[0.1],
+                provider="mock",
+                model="mock-model",
+                cached=False,
+            )
+            for value in texts
+        ]
+
+    monkeypatch.setattr("embx.engine.EmbeddingEngine.embed_texts", fake_embed_texts)
+
+    content = "old\rmac\r\rlines\x0bvertical\x1cfile\u2028para\nunix\n"
+    with runner.isolated_filesystem():
+        input_path = Path("inputs.txt")
+        input_path.write_bytes(content.encode("utf-8"))
+        result = runner.invoke(app, ["batch", str(input_path)])
+
+    assert result.exit_code == 0
+    expected = [line for line in content.splitlines() if line.strip()]
+    assert seen == [expected]
+    assert expected == ["old", "mac", "lines", "vertical", "file", "para", "unix"]
+
+
+def test_batch_json_output_file_embeds_duplicates_once(monkeypatch) -> None:
+    seen: list[list[str]] = []
+
+    async def fake_embed_texts(
+        self,
+        texts,
+        provider_name,
+        model=None,
+        dimensions=None,
+        use_cache=True,
+    ):
+        _ = (provider_name, model, dimensions, use_cache)
+        seen.append(list(texts))
+        return [
+            EmbeddingResult(
+                text=value,
+                vector=[0.1, 0.2],
+                provider="mock",
+                model="mock-model",
+                cached=False,
+            )
+            for value in texts
+        ]
+
+    monkeypatch.setattr("embx.engine.EmbeddingEngine.embed_texts", fake_embed_texts)
+
+    with runner.isolated_filesystem():
+        input_path = Path("inputs.txt")
+        input_path.write_text("first\nsecond\nfirst\n", encoding="utf-8")
+        result = runner.invoke(
+            app, ["batch", str(input_path), "--format", "json", "--output", "out/rows.json"]
+        )
+        payload = json.loads(Path("out/rows.json").read_text(encoding="utf-8"))
+
+    assert result.exit_code == 0
+    assert seen == [["first", "second"]]
+    assert [row["text"] for row in payload] == ["first", "second", "first"]
+    assert payload[0]["vector"] == [0.1, 0.2]
+
+
 def test_embed_csv_output(monkeypatch) -> None:
     async def fake_embed_texts(
         self,
@@ -1285,12 +1542,12 @@ def test_doctor_network_check_for_ollama(monkeypatch) -> None:
     class Response:
         status_code = 200
 
-    def fake_get(url: str, timeout: int):
-        _ = timeout
+    async def fake_get(self, url: str):
+        _ = self
         assert url.endswith("/api/tags")
         return Response()
 
-    monkeypatch.setattr("embx.commands.shared.httpx.get", fake_get)
+    monkeypatch.setattr("httpx.AsyncClient.get", fake_get)
 
     result = runner.invoke(
         app,
@@ -1396,3 +1653,177 @@ def test_ping_failure_returns_exit_2(monkeypatch) -> None:
     result = runner.invoke(app, ["ping", "--provider", "openai"])
     assert result.exit_code == 2
     assert "Ping failed for provider 'openai': unauthorized" in result.output
+
+
+def test_dumps_json_agrees_with_stdlib_fallback(monkeypatch) -> None:
+    from embx.commands import shared
+
+    data = [
+        {
+            "provider": "openai",
+            "text": "café ☕",
+            "vector": [0.1, -2.5],
+            "cached": False,
+            "cost_usd": None,
+        }
+    ]
+    tiny_and_huge = [{"vector": [1.2e-05, -3e-7, 1e16]}]
+    fast = shared.dumps_json(data)
+    fast_floats = shared.dumps_json(tiny_and_huge)
+    monkeypatch.setattr(shared, "orjson", None)
+
+    assert '"text": "café ☕"' in fast
+    assert shared.dumps_json(data) == fast
+    # orjson spells these 0.000012 / -3e-7 / 1e16, the stdlib 1.2e-05 / -3e-07 / 1e+16.
+    assert json.loads(shared.dumps_json(tiny_and_huge)) == json.loads(fast_floats) == tiny_and_huge
+
+
+def test_safe_vector_preview_formats_and_truncates() -> None:
+    from embx.commands.shared import safe_vector_preview
+
+    assert safe_vector_preview([0.1, -2.0], size=8) == "[0.10000, -2.00000]"
+    assert safe_vector_preview([1.0, 2.0, 3.0], size=2) == "[1.00000, 2.00000 ...]"
+    assert safe_vector_preview([], size=2) == "[]"
+
+
+def test_register_all_commands_only_registers_requested_command() -> None:
+    import typer
+
+    from embx.commands import register_all_commands
+
+    lazy_app = typer.Typer()
+    lazy_config_app = typer.Typer()
+    register_all_commands(
+        app=lazy_app,
+        config_app=lazy_config_app,
+        cache_app=typer.Typer(),
+        command_name="embed",
+    )
+
+    assert [command.name for command in lazy_app.registered_commands] == ["embed"]
+    assert lazy_config_app.registered_commands == []
+
+    full_app = typer.Typer()
+    register_all_commands(
+        app=full_app,
+        config_app=typer.Typer(),
+        cache_app=typer.Typer(),
+        command_name="--help",
+    )
+
+    assert len(full_app.registered_commands) == 9
+
+
+def test_cache_vacuum_reports_sizes(monkeypatch, tmp_path: Path) -> None:
+    from embx.cache import EmbeddingCache
+
+    cache_path = tmp_path / "cache.db"
+    monkeypatch.setenv("EMBX_CACHE_PATH", str(cache_path))
+    cache = EmbeddingCache(enabled=True, path=cache_path)
+    cache.set(provider="dummy", model="m", dimensions=None, text="hello", vector=[0.5])
+    cache.close()
+
+    result = runner.invoke(app, ["cache", "vacuum", "--json"])
+
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload["path"] == str(cache_path)
+    assert payload["size_after_bytes"] > 0
+
+
+def test_cache_vacuum_without_database(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("EMBX_CACHE_PATH", str(tmp_path / "missing.db"))
+
+    result = runner.invoke(app, ["cache", "vacuum"])
+
+    assert result.exit_code == 2
+    assert "No cache database found" in result.output
+
+
+def test_resolve_config_memo_tracks_env_and_file(monkeypatch, tmp_path: Path) -> None:
+    from embx.config import resolve_config, upsert_config
+
+    monkeypatch.setenv("EMBX_CONFIG_PATH", str(tmp_path / "config.json"))
+    monkeypatch.setenv("EMBX_PROVIDER", "voyage")
+
+    first = resolve_config()
+    first["default_provider"] = "mutated"
+    assert resolve_config()["default_provider"] == "voyage"
+
+    monkeypatch.setenv("EMBX_PROVIDER", "ollama")
+    assert resolve_config()["default_provider"] == "ollama"
+
+    monkeypatch.delenv("EMBX_PROVIDER")
+    upsert_config({"default_provider": "openrouter"})
+    assert resolve_config()["default_provider"] == "openrouter"
+
+
+def test_run_connection_tests_keeps_order_and_maps_errors(monkeypatch) -> None:
+    from embx.commands.shared import run_connection_tests
+
+    async def fake_test_provider_connection(provider_name: str, config: dict, timeout_seconds: int):
+        _ = (config, timeout_seconds)
+        if provider_name == "voyage":
+            raise RuntimeError("socket closed")
+        return True, f"{provider_name} ok"
+
+    monkeypatch.setattr(
+        "embx.providers.discovery.test_provider_connection",
+        fake_test_provider_connection,
+    )
+
+    results = run_connection_tests(["openai", "voyage", "ollama"], {}, 3)
+
+    assert results == [(True, "openai ok"), (False, "socket closed"), (True, "ollama ok")]
+
+
+def test_command_registration_defers_engine_imports() -> None:
+    import subprocess
+    import sys
+
+    script = (
+        "import sys\n"
+        "sys.argv = ['embx', sys.argv[1], '--help']\n"
+        "import embx.cli\n"
+        "heavy = ('asyncio', 'httpx', 'embx.engine', 'embx.providers', 'embx.config')\n"
+        "print(','.join(name for name in heavy if name in sys.modules))\n"
+    )
+    for command in ("embed", "ping"):
+        completed = subprocess.run(
+            [sys.executable, "-c", script, command],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert completed.stdout.strip() == "", command
+
+
+def test_dumps_json_line_is_compact_utf8_on_both_paths(monkeypatch) -> None:
+    from embx.commands import shared
+
+    row = {"text": "café ☕", "vector": [0.5, -1.0], "cached": False}
+    expected = '{"text":"café ☕","vector":[0.5,-1.0],"cached":false}'.encode()
+    tiny_and_huge = {"vector": [1.2e-05, -3e-7, 1e16]}
+    fast_floats = shared.dumps_json_line(tiny_and_huge)
+    assert shared.dumps_json_line(row) == expected
+    monkeypatch.setattr(shared, "orjson", None)
+    assert shared.dumps_json_line(row) == expected
+
+    # Float spelling may differ between the two paths; the values must not.
+    stdlib_floats = shared.dumps_json_line(tiny_and_huge)
+    assert b" " not in stdlib_floats
+    assert json.loads(stdlib_floats) == json.loads(fast_floats) == tiny_and_huge
+
+
+def test_batch_stdout_falls_back_to_text_only_streams() -> None:
+    import contextlib
+    import io
+
+    from embx.commands.batch import _iter_encoded_rows, _write_stdout
+
+    rows = [{"text": "café", "vector": [0.5]}]
+    captured = io.StringIO()
+    with contextlib.redirect_stdout(captured):
+        _write_stdout(_iter_encoded_rows(rows, "jsonl"))
+
+    assert [json.loads(line) for line in captured.getvalue().splitlines()] == rows
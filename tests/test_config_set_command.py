@@ -40,3 +40,39 @@ def test_config_set_invalid_key_fails() -> None:
     )
     assert result.exit_code == 2
     assert "Unknown config key" in result.output
+
+
+def test_load_file_config_reuses_parse_until_file_changes(monkeypatch, tmp_path: Path) -> None:
+    from embx import config
+
+    config_path = tmp_path / "config.json"
+    monkeypatch.setenv("EMBX_CONFIG_PATH", str(config_path))
+    config.upsert_config({"default_provider": "voyage"})
+
+    def fail_read(self, *args, **kwargs):
+        raise AssertionError("config file should not be re-read")
+
+    monkeypatch.setattr(Path, "read_text", fail_read)
+    assert config.load_file_config()["default_provider"] == "voyage"
+    monkeypatch.undo()
+
+    monkeypatch.setenv("EMBX_CONFIG_PATH", str(config_path))
+    config_path.write_text(json.dumps({"default_provider": "ollama", "x": 1}), encoding="utf-8")
+    assert config.load_file_config()["default_provider"] == "ollama"
+
+
+def test_upsert_config_replaces_file_atomically_and_keeps_mode(monkeypatch, tmp_path: Path) -> None:
+    from embx import config
+
+    config_path = tmp_path / "config.json"
+    monkeypatch.setenv("EMBX_CONFIG_PATH", str(config_path))
+    config_path.write_text(json.dumps({"default_provider": "voyage"}), encoding="utf-8")
+    config_path.chmod(0o600)
+
+    config.upsert_config({"default_model": "voyage-3-lite"})
+
+    data = json.loads(config_path.read_text(encoding="utf-8"))
+    assert data["default_provider"] == "voyage"
+    assert data["default_model"] == "voyage-3-lite"
+    assert config_path.stat().st_mode & 0o777 == 0o600
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["config.json"]
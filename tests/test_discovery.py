@@ -137,3 +137,51 @@ def test_huggingface_remote_model_discovery(monkeypatch) -> None:
     assert captured["params"]["pipeline_tag"] == "feature-extraction"
     assert captured["headers"]["Authorization"] == "Bearer hf_test"
     assert rows[0]["id"] == "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def test_cached_model_discovery_reuses_fresh_listing(monkeypatch) -> None:
+    from embx.providers import discovery
+
+    calls: list[str] = []
+
+    async def fake_list(provider_name, config, timeout_seconds, source="remote"):
+        calls.append(provider_name)
+        return [{"id": f"model-{len(calls)}"}]
+
+    monkeypatch.setattr(discovery, "list_embedding_models", fake_list)
+
+    def cached(**kwargs):
+        return asyncio.run(
+            discovery.list_embedding_models_cached(
+                provider_name="openai", config={}, timeout_seconds=5, **kwargs
+            )
+        )
+
+    assert cached() == [{"id": "model-1"}]
+    assert cached() == [{"id": "model-1"}]
+    assert cached(use_cache=False) == [{"id": "model-2"}]
+    assert cached(ttl_seconds=0) == [{"id": "model-3"}]
+    assert calls == ["openai", "openai", "openai"]
+
+
+def test_cached_model_discovery_serves_stale_listing_when_offline(monkeypatch) -> None:
+    from embx.exceptions import ProviderError
+    from embx.providers import discovery
+
+    async def fake_list(provider_name, config, timeout_seconds, source="remote"):
+        return [{"id": "model/a"}]
+
+    async def offline_list(provider_name, config, timeout_seconds, source="remote"):
+        raise ProviderError("offline")
+
+    def cached():
+        return asyncio.run(
+            discovery.list_embedding_models_cached(
+                provider_name="ollama", config={}, timeout_seconds=5, ttl_seconds=0
+            )
+        )
+
+    monkeypatch.setattr(discovery, "list_embedding_models", fake_list)
+    cached()
+    monkeypatch.setattr(discovery, "list_embedding_models", offline_list)
+    assert cached() == [{"id": "model/a"}]
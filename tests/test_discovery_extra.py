@@ -43,3 +43,25 @@ def test_test_provider_connection_voyage_branch(monkeypatch) -> None:
     )
     assert ok is True
     assert "Voyage embeddings request succeeded" in message
+
+
+def test_huggingface_max_rows_limits_remote_request(monkeypatch) -> None:
+    captured: dict = {}
+
+    async def fake_remote(config, timeout_seconds, limit=200):
+        _ = (config, timeout_seconds)
+        captured["limit"] = limit
+        return [{"id": "a/model"}]
+
+    monkeypatch.setattr(discovery, "_list_huggingface_remote_models", fake_remote)
+
+    asyncio.run(
+        discovery.list_embedding_models(
+            provider_name="huggingface",
+            config={},
+            timeout_seconds=3,
+            source="remote",
+            max_rows=3,
+        )
+    )
+    assert captured["limit"] == 3
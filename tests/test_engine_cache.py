@@ -1,4 +1,6 @@
 import asyncio
+import json
+import sqlite3
 from pathlib import Path
 
 from embx.cache import EmbeddingCache
@@ -58,6 +60,101 @@ def test_embedding_cache_roundtrip(tmp_path: Path) -> None:
     assert cache.get("dummy", "m", 2, "missing") is None
 
 
+def test_embedding_cache_get_many_returns_hits_by_text(tmp_path: Path) -> None:
+    cache = EmbeddingCache(enabled=True, path=tmp_path / "cache.db")
+    cache.set(provider="dummy", model="m", dimensions=2, text="alpha", vector=[0.1, 0.2])
+    cache.set(provider="dummy", model="m", dimensions=2, text="beta", vector=[0.3, 0.4])
+
+    found = cache.get_many("dummy", "m", 2, ["alpha", "missing", "beta", "alpha"])
+
+    assert found == {"alpha": [0.1, 0.2], "beta": [0.3, 0.4]}
+    assert cache.get_many("dummy", "other", 2, ["alpha"]) == {}
+
+
+def test_embedding_cache_set_many_roundtrip(tmp_path: Path) -> None:
+    cache = EmbeddingCache(enabled=True, path=tmp_path / "cache.db")
+
+    cache.set_many(
+        provider="dummy",
+        model="m",
+        dimensions=None,
+        items=[("alpha", [1.0, 0.0]), ("beta", [0.0, 1.0])],
+    )
+
+    assert cache.get("dummy", "m", None, "alpha") == [1.0, 0.0]
+    assert cache.get_many("dummy", "m", None, ["alpha", "beta"]) == {
+        "alpha": [1.0, 0.0],
+        "beta": [0.0, 1.0],
+    }
+
+
+def test_embedding_cache_reopens_after_close(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.db"
+    cache = EmbeddingCache(enabled=True, path=cache_path)
+    cache.set(provider="dummy", model="m", dimensions=2, text="hello", vector=[0.5, 0.5])
+    cache.close()
+    cache.close()
+
+    assert cache.get("dummy", "m", 2, "hello") == [0.5, 0.5]
+    assert EmbeddingCache(enabled=True, path=cache_path).get("dummy", "m", 2, "hello") == [
+        0.5,
+        0.5,
+    ]
+
+
+def test_embedding_cache_recreates_legacy_schema(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.db"
+    with sqlite3.connect(cache_path) as conn:
+        conn.execute(
+            "CREATE TABLE embeddings (cache_key TEXT PRIMARY KEY, vector_json TEXT NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO embeddings(cache_key, vector_json) VALUES (?, ?)",
+            ("legacy-sha256-key", json.dumps([0.25, -1.5])),
+        )
+
+    cache = EmbeddingCache(enabled=True, path=cache_path)
+    assert cache.get("dummy", "m", 2, "hello") is None
+
+    cache.set(provider="dummy", model="m", dimensions=2, text="hello", vector=[0.25, -1.5])
+    assert cache.get("dummy", "m", 2, "hello") == [0.25, -1.5]
+
+
+def test_embedding_cache_compresses_redundant_vectors(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.db"
+    vector = [0.0] * 512 + [1.5, -2.25]
+    cache = EmbeddingCache(enabled=True, path=cache_path)
+
+    cache.set(provider="dummy", model="m", dimensions=None, text="hello", vector=vector)
+    cache.set(provider="dummy", model="m", dimensions=None, text="short", vector=[0.5])
+
+    assert cache.get("dummy", "m", None, "hello") == vector
+    assert cache.get("dummy", "m", None, "short") == [0.5]
+    stored_size = cache._connection().execute("SELECT MAX(LENGTH(vector_blob)) FROM embeddings")
+    assert stored_size.fetchone()[0] < len(vector) * 8
+
+
+def test_embedding_cache_records_optimize_watermark(tmp_path: Path) -> None:
+    cache = EmbeddingCache(enabled=True, path=tmp_path / "cache.db")
+
+    row = (
+        cache._connection()
+        .execute("SELECT value FROM cache_meta WHERE key = 'optimized_page_count'")
+        .fetchone()
+    )
+
+    assert row is not None
+    assert row[0] > 0
+
+
+def test_build_keys_matches_build_key() -> None:
+    texts = ["alpha", "", "héllo"]
+
+    keys = EmbeddingCache.build_keys("dummy", "m", None, texts)
+
+    assert keys == [EmbeddingCache.build_key("dummy", "m", None, text) for text in texts]
+
+
 def test_embedding_cache_disabled_is_noop(tmp_path: Path) -> None:
     cache_path = tmp_path / "cache.db"
     cache = EmbeddingCache(enabled=False, path=cache_path)
@@ -220,3 +317,114 @@ def test_engine_retry_exhaustion_raises(monkeypatch, tmp_path: Path) -> None:
         assert "always failing" in str(exc)
     else:
         raise AssertionError("Expected ProviderError")
+
+
+def test_get_engine_reuses_engine_for_equal_config(monkeypatch, tmp_path: Path) -> None:
+    from embx.engine import get_engine
+
+    monkeypatch.setenv("EMBX_CACHE_PATH", str(tmp_path / "cache.db"))
+
+    first = get_engine({"cache_enabled": True, "retry_attempts": 0})
+    second = get_engine({"retry_attempts": 0, "cache_enabled": True})
+    other = get_engine({"cache_enabled": True, "retry_attempts": 2})
+
+    assert first is second
+    assert other is not first
+
+
+def test_get_provider_reuses_instances_until_cleared() -> None:
+    from embx.providers import clear_provider_cache, get_provider
+
+    first = get_provider("openai")
+    assert get_provider("openai") is first
+
+    clear_provider_cache()
+    assert get_provider("openai") is not first
+
+
+def test_engine_reuses_one_http_client_per_loop(monkeypatch) -> None:
+    from embx.providers.base import http_client
+
+    seen: list[object] = []
+
+    class ClientProbeProvider(DummyProvider):
+        async def embed(self, texts, model, dimensions, timeout_seconds, config):
+            async with http_client(timeout_seconds) as client:
+                seen.append(client)
+            return await super().embed(texts, model, dimensions, timeout_seconds, config)
+
+    provider = ClientProbeProvider()
+    monkeypatch.setattr("embx.engine.get_provider", lambda _: provider)
+    engine = EmbeddingEngine({"cache_enabled": False})
+
+    async def run() -> None:
+        for text in ("alpha", "beta"):
+            await engine.embed_texts(texts=[text], provider_name="dummy", use_cache=False)
+        await engine.aclose()
+
+    asyncio.run(run())
+
+    assert len(seen) == 2
+    assert seen[0] is seen[1]
+    assert seen[0].is_closed
+
+
+def test_engine_sends_misses_shortest_first_and_restores_order(monkeypatch) -> None:
+    provider = DummyProvider()
+    monkeypatch.setattr("embx.engine.get_provider", lambda _: provider)
+    engine = EmbeddingEngine({"cache_enabled": False})
+
+    texts = ["a much longer text", "mid text", "s"]
+    results = asyncio.run(engine.embed_texts(texts=texts, provider_name="dummy", use_cache=False))
+
+    assert provider.calls[0]["texts"] == ["s", "mid text", "a much longer text"]
+    assert [result.text for result in results] == texts
+
+
+def test_engine_http_client_is_closed_when_its_loop_ends(monkeypatch) -> None:
+    from embx.providers.base import http_client
+
+    seen: list[object] = []
+
+    class ClientProbeProvider(DummyProvider):
+        async def embed(self, texts, model, dimensions, timeout_seconds, config):
+            async with http_client(timeout_seconds) as client:
+                seen.append(client)
+            return await super().embed(texts, model, dimensions, timeout_seconds, config)
+
+    provider = ClientProbeProvider()
+    monkeypatch.setattr("embx.engine.get_provider", lambda _: provider)
+    engine = EmbeddingEngine({"cache_enabled": False})
+
+    for text in ("alpha", "beta"):
+        asyncio.run(engine.embed_texts(texts=[text], provider_name="dummy", use_cache=False))
+
+    assert seen[0] is not seen[1]
+    assert seen[0].is_closed
+    assert seen[1].is_closed
+
+
+def test_engine_uses_an_already_bound_http_client(monkeypatch) -> None:
+    from embx.providers.base import http_client, shared_http_client
+
+    seen: list[object] = []
+
+    class ClientProbeProvider(DummyProvider):
+        async def embed(self, texts, model, dimensions, timeout_seconds, config):
+            async with http_client(timeout_seconds) as client:
+                seen.append(client)
+            return await super().embed(texts, model, dimensions, timeout_seconds, config)
+
+    provider = ClientProbeProvider()
+    monkeypatch.setattr("embx.engine.get_provider", lambda _: provider)
+    engine = EmbeddingEngine({"cache_enabled": False})
+
+    async def run() -> object:
+        async with shared_http_client(5) as shared:
+            await engine.embed_texts(texts=["alpha"], provider_name="dummy", use_cache=False)
+        return shared
+
+    shared = asyncio.run(run())
+
+    assert seen == [shared]
+    assert engine._http is None
@@ -75,3 +75,55 @@ def test_huggingface_success_parses_response(monkeypatch) -> None:
     assert len(results) == 2
     assert results[0].provider == "huggingface"
     assert len(results[0].vector) == 3
+
+
+def test_huggingface_splits_large_inputs_into_ordered_batches(monkeypatch) -> None:
+    posted: list[list[str]] = []
+
+    class FakeResponse:
+        status_code = 200
+
+        def __init__(self, inputs: list[str]) -> None:
+            self.inputs = inputs
+
+        def json(self):
+            return [[float(len(text))] for text in self.inputs]
+
+        @property
+        def text(self) -> str:
+            return "ok"
+
+    class FakeAsyncClient:
+        def __init__(self, timeout: int):
+            _ = timeout
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            _ = (exc_type, exc, tb)
+            return False
+
+        async def post(self, url: str, json: dict, headers: dict):
+            _ = (url, headers)
+            posted.append(json["inputs"])
+            return FakeResponse(json["inputs"])
+
+    monkeypatch.setattr("embx.providers.huggingface_provider.httpx.AsyncClient", FakeAsyncClient)
+
+    provider = HuggingFaceProvider()
+    provider.max_batch_size = 2
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+    results = asyncio.run(
+        provider.embed(
+            texts=texts,
+            model="sentence-transformers/all-MiniLM-L6-v2",
+            dimensions=None,
+            timeout_seconds=9,
+            config={"huggingface_api_key": "hf_test"},
+        )
+    )
+
+    assert sorted(posted) == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+    assert [result.text for result in results] == texts
+    assert [result.vector for result in results] == [[1.0], [2.0], [3.0], [4.0], [5.0]]
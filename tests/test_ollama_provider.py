@@ -0,0 +1,57 @@
+import asyncio
+
+from embx.providers.ollama_provider import OllamaProvider
+
+
+def test_ollama_embeds_concurrently_in_input_order(monkeypatch) -> None:
+    in_flight = {"now": 0, "peak": 0}
+
+    class FakeResponse:
+        status_code = 200
+
+        def __init__(self, prompt: str) -> None:
+            self.prompt = prompt
+
+        def json(self):
+            return {"embedding": [float(len(self.prompt))]}
+
+        @property
+        def text(self) -> str:
+            return "ok"
+
+    class FakeAsyncClient:
+        def __init__(self, timeout: int):
+            _ = timeout
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            _ = (exc_type, exc, tb)
+            return False
+
+        async def post(self, url: str, json: dict):
+            _ = url
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            # Longer prompts finish first, so completion order differs from input order.
+            await asyncio.sleep(0.01 / len(json["prompt"]))
+            in_flight["now"] -= 1
+            return FakeResponse(json["prompt"])
+
+    monkeypatch.setattr("embx.providers.base.httpx.AsyncClient", FakeAsyncClient)
+
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+    results = asyncio.run(
+        OllamaProvider().embed(
+            texts=texts,
+            model="nomic-embed-text",
+            dimensions=None,
+            timeout_seconds=5,
+            config={"ollama_concurrency": 2},
+        )
+    )
+
+    assert [result.text for result in results] == texts
+    assert [result.vector for result in results] == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert in_flight["peak"] == 2
@@ -84,3 +84,53 @@ def test_openrouter_success_parses_response(monkeypatch) -> None:
     assert results[0].provider == "openrouter"
     assert results[0].input_tokens == 8
     assert results[0].cost_usd == 0.0000016
+
+
+def test_openrouter_reuses_shared_http_client(monkeypatch) -> None:
+    from embx.providers.base import shared_http_client
+
+    created: list[int] = []
+
+    class FakeResponse:
+        status_code = 200
+
+        def json(self):
+            return {"data": [{"embedding": [0.1, 0.2]}], "usage": {}}
+
+        @property
+        def text(self) -> str:
+            return "ok"
+
+    class FakeAsyncClient:
+        def __init__(self, timeout: int):
+            created.append(timeout)
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            _ = (exc_type, exc, tb)
+            return False
+
+        async def post(self, url: str, json: dict, headers: dict):
+            _ = (url, json, headers)
+            return FakeResponse()
+
+    monkeypatch.setattr("embx.providers.base.httpx.AsyncClient", FakeAsyncClient)
+
+    provider = OpenRouterProvider()
+
+    async def embed_twice() -> None:
+        async with shared_http_client(9):
+            for text in ("first", "second"):
+                await provider.embed(
+                    texts=[text],
+                    model="openai/text-embedding-3-small",
+                    dimensions=None,
+                    timeout_seconds=5,
+                    config={"openrouter_api_key": "sk-test"},
+                )
+
+    asyncio.run(embed_twice())
+
+    assert created == [9]
@@ -52,3 +52,39 @@ def test_apply_ranking_none_preserves_order_and_no_rank() -> None:
 
     assert [row["provider"] for row in result.ranked_rows] == ["x", "y"]
     assert all(row["rank"] is None for row in result.ranked_rows)
+
+
+def test_apply_ranking_top_keeps_best_rows_only() -> None:
+    rows = [
+        {"provider": "slow", "status": "ok", "latency_ms": 30.0, "_vector": [1.0]},
+        {"provider": "fast", "status": "ok", "latency_ms": 5.0, "_vector": [1.0]},
+        {"provider": "mid", "status": "ok", "latency_ms": 12.0, "_vector": [1.0]},
+        {"provider": "broken", "status": "error", "latency_ms": 1.0, "_vector": None},
+    ]
+
+    result = apply_ranking(rows, "latency", top=2)
+
+    assert [row["provider"] for row in result.successful_rows] == ["fast", "mid"]
+    assert [row["rank"] for row in result.successful_rows] == [1, 2]
+    assert [row["provider"] for row in result.error_rows] == ["broken"]
+
+
+def test_apply_ranking_top_supports_single_argument_strategies(monkeypatch) -> None:
+    from embx import ranking
+
+    monkeypatch.setattr(ranking, "RANKING_FACTORY", dict(ranking.RANKING_FACTORY))
+
+    @ranking.register_ranking("alphabetical")
+    def _rank_alphabetical(rows):
+        return sorted(rows, key=lambda row: row["provider"])
+
+    rows = [
+        {"provider": "c", "status": "ok", "_vector": [1.0]},
+        {"provider": "a", "status": "ok", "_vector": [1.0]},
+        {"provider": "b", "status": "ok", "_vector": [1.0]},
+    ]
+
+    result = apply_ranking(rows, "alphabetical", top=2)
+
+    assert [row["provider"] for row in result.successful_rows] == ["a", "b"]
+    assert [row["rank"] for row in result.successful_rows] == [1, 2]